@@ -1,8 +1,11 @@
 """
 Data Transfer Objects (DTOs) for API layer
 Following Interface Segregation Principle - separate request/response models
+
+Literal choices are validated on request DTOs only; response DTOs are built
+from domain models whose values are already constrained
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Literal
 
 
@@ -23,29 +26,33 @@ class SPARQLQueryRequest(BaseModel):
 
 
 # Response DTOs
-class EntityDTO(BaseModel):
+class _ResponseDTO(BaseModel):
+    """Base for response DTOs, which are never mutated after construction"""
+    model_config = ConfigDict(frozen=True)
+
+
+class _AliasableDTO(_ResponseDTO):
+    """Base for DTOs that accept both field names and aliases"""
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class EntityDTO(_AliasableDTO):
     """Entity response model"""
     id: str
     label: str
-    type: Literal["country", "region", "organization"]
+    type: str
     iso3Code: Optional[str] = Field(None, alias="iso3Code")
-    
-    class Config:
-        populate_by_name = True
 
 
-class SearchResponseDTO(BaseModel):
+class SearchResponseDTO(_AliasableDTO):
     """Search response model"""
     results: List[EntityDTO]
     total: int
     page: int
     pageSize: int = Field(alias="pageSize")
-    
-    class Config:
-        populate_by_name = True
 
 
-class HealthRecordDTO(BaseModel):
+class HealthRecordDTO(_ResponseDTO):
     """Health record response model"""
     id: str
     location: str
@@ -76,78 +83,78 @@ class HealthRecordDTO(BaseModel):
     populationAge0: Optional[float] = None
 
 
-class HealthMetricItemDTO(BaseModel):
+class HealthMetricItemDTO(_ResponseDTO):
     """Health metric item"""
     id: str
     label: str
     value: float
     year: int
     unit: Optional[str] = None
-    category: Literal["disease", "vaccination", "population"]
+    category: str
 
 
-class HealthMetricsDTO(BaseModel):
+class HealthMetricsDTO(_ResponseDTO):
     """Grouped health metrics"""
-    diseaseCases: List[HealthMetricItemDTO] = []
-    vaccinationCoverage: List[HealthMetricItemDTO] = []
-    population: List[HealthMetricItemDTO] = []
-    availableYears: List[int] = []
+    diseaseCases: List[HealthMetricItemDTO] = Field(default_factory=list)
+    vaccinationCoverage: List[HealthMetricItemDTO] = Field(default_factory=list)
+    population: List[HealthMetricItemDTO] = Field(default_factory=list)
+    availableYears: List[int] = Field(default_factory=list)
 
 
-class EntityAttributeDTO(BaseModel):
+class EntityAttributeDTO(_ResponseDTO):
     """Entity attribute"""
     property: str
     propertyLabel: str
     value: str
     valueLabel: Optional[str] = None
-    valueType: Literal["string", "number", "date", "uri", "entity"] = "string"
+    valueType: str = "string"
     unit: Optional[str] = None
 
 
-class RelatedEntityDTO(BaseModel):
+class RelatedEntityDTO(_ResponseDTO):
     """Related entity"""
     id: str
     label: str
-    type: Literal["country", "region", "organization"]
+    type: str
     relationshipType: str
     relationshipLabel: str
     description: Optional[str] = None
 
 
-class EntitySourceDTO(BaseModel):
+class EntitySourceDTO(_ResponseDTO):
     """Entity source"""
     name: str
     url: Optional[str] = None
     date: Optional[str] = None
 
 
-class EntityInfoDTO(BaseModel):
+class EntityInfoDTO(_ResponseDTO):
     """Complete entity information"""
     id: str
     label: str
-    type: Literal["country", "region", "organization"]
+    type: str
     description: Optional[str] = None
     image: Optional[str] = None
-    attributes: List[EntityAttributeDTO] = []
+    attributes: List[EntityAttributeDTO] = Field(default_factory=list)
     healthMetrics: Optional[HealthMetricsDTO] = None
-    relatedEntities: List[RelatedEntityDTO] = []
-    sources: List[EntitySourceDTO] = []
+    relatedEntities: List[RelatedEntityDTO] = Field(default_factory=list)
+    sources: List[EntitySourceDTO] = Field(default_factory=list)
 
 
-class InfoBoxResponseDTO(BaseModel):
+class InfoBoxResponseDTO(_ResponseDTO):
     """InfoBox response"""
     entity: EntityInfoDTO
     sparqlQuery: Optional[str] = None
 
 
-class EntityDetailResponseDTO(BaseModel):
+class EntityDetailResponseDTO(_ResponseDTO):
     """Entity detail response with health records"""
     entity: EntityDTO
-    healthRecords: List[HealthRecordDTO] = []
+    healthRecords: List[HealthRecordDTO] = Field(default_factory=list)
     relatedEntities: Optional[List[EntityDTO]] = None
 
 
-class CountryCoordinatesDTO(BaseModel):
+class CountryCoordinatesDTO(_ResponseDTO):
     """Country coordinates"""
     iso3Code: str
     label: str
@@ -155,35 +162,32 @@ class CountryCoordinatesDTO(BaseModel):
     longitude: float
 
 
-class SPARQLValueDTO(BaseModel):
+class SPARQLValueDTO(_AliasableDTO):
     """SPARQL result value"""
-    type: Literal["uri", "literal", "bnode"]
+    type: str
     value: str
     datatype: Optional[str] = None
     lang: Optional[str] = Field(None, alias="xml:lang")
-    
-    class Config:
-        populate_by_name = True
 
 
-class SPARQLQueryResponseDTO(BaseModel):
+class SPARQLQueryResponseDTO(_ResponseDTO):
     """SPARQL query response"""
     head: dict
     results: dict
 
 
-class SPARQLValidationResponseDTO(BaseModel):
+class SPARQLValidationResponseDTO(_ResponseDTO):
     """SPARQL validation response"""
     valid: bool
     error: Optional[str] = None
 
 
-class SampleQueriesResponseDTO(BaseModel):
+class SampleQueriesResponseDTO(_ResponseDTO):
     """Sample queries response"""
     queries: List[str]
 
 
-class ErrorResponseDTO(BaseModel):
+class ErrorResponseDTO(_ResponseDTO):
     """Error response"""
     message: str
     code: Optional[str] = None
@@ -1,11 +1,16 @@
 """
 Mappers to convert between domain models and DTOs
 Following Single Responsibility Principle
+
+Domain objects are built unvalidated from trusted SPARQL parsing and the
+DTO fields mirror them, so DTOs are built with model_construct to skip
+Pydantic validation on the response path
 """
-from typing import List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
 from app.domain.models import (
     Entity, EntityInfo, HealthRecord, CountryCoordinates,
-    HealthMetrics, HealthMetricItem, EntityAttribute,
+    HealthMetrics, HealthMetricsArray, EntityAttribute,
     RelatedEntity, EntitySource
 )
 from app.application.dto import (
@@ -16,13 +21,42 @@ from app.application.dto import (
 )
 
 
+# HealthRecord attribute -> HealthRecordDTO field
+_HR_FIELDS = (
+    ("id", "id"),
+    ("location", "location"),
+    ("year", "year"),
+    ("hiv_cases", "hivCases"),
+    ("malaria_cases", "malariaCases"),
+    ("rabies_cases", "rabiesCases"),
+    ("tuberculosis_cases", "tuberculosisCases"),
+    ("cholera_cases", "choleraCases"),
+    ("guineaworm", "guineaworm"),
+    ("polio_cases", "polioCases"),
+    ("smallpox_cases", "smallpoxCases"),
+    ("yaws_cases", "yawsCases"),
+    ("bcg", "bcg"),
+    ("dtp3", "dtp3"),
+    ("hepb3", "hepb3"),
+    ("hib3", "hib3"),
+    ("measles1", "measles1"),
+    ("polio3", "polio3"),
+    ("rotavirus", "rotavirus"),
+    ("rubella1", "rubella1"),
+    ("population_age0", "populationAge0"),
+)
+_HR_ALIASES = tuple(alias for _, alias in _HR_FIELDS)
+# Reads every mapped attribute in one C-level call
+_hr_values = attrgetter(*(attr for attr, _ in _HR_FIELDS))
+
+
 class EntityMapper:
     """Maps Entity domain model to DTO"""
     
     @staticmethod
     def to_dto(entity: Entity) -> EntityDTO:
         """Convert Entity to EntityDTO"""
-        return EntityDTO(
+        return EntityDTO.model_construct(
             id=entity.id,
             label=entity.label,
             type=entity.type,
@@ -32,7 +66,24 @@ class EntityMapper:
     @staticmethod
     def to_dto_list(entities: List[Entity]) -> List[EntityDTO]:
         """Convert list of Entities to DTOs"""
-        return [EntityMapper.to_dto(e) for e in entities]
+        construct = EntityDTO.model_construct
+        return [
+            construct(id=e.id, label=e.label, type=e.type, iso3Code=e.iso3_code)
+            for e in entities
+        ]
+    
+    @staticmethod
+    def to_dict(entity: Entity) -> Dict[str, Any]:
+        """Convert Entity straight to an EntityDTO-shaped dict (no Pydantic)"""
+        return {"id": entity.id, "label": entity.label, "type": entity.type, "iso3Code": entity.iso3_code}
+    
+    @staticmethod
+    def to_dict_list(entities: List[Entity]) -> List[Dict[str, Any]]:
+        """Convert Entities straight to EntityDTO-shaped dicts (no Pydantic)"""
+        return [
+            {"id": e.id, "label": e.label, "type": e.type, "iso3Code": e.iso3_code}
+            for e in entities
+        ]
 
 
 class HealthRecordMapper:
@@ -41,34 +92,21 @@ class HealthRecordMapper:
     @staticmethod
     def to_dto(record: HealthRecord) -> HealthRecordDTO:
         """Convert HealthRecord to HealthRecordDTO"""
-        return HealthRecordDTO(
-            id=record.id,
-            location=record.location,
-            year=record.year,
-            hivCases=record.hiv_cases,
-            malariaCases=record.malaria_cases,
-            rabiesCases=record.rabies_cases,
-            tuberculosisCases=record.tuberculosis_cases,
-            choleraCases=record.cholera_cases,
-            guineaworm=record.guineaworm,
-            polioCases=record.polio_cases,
-            smallpoxCases=record.smallpox_cases,
-            yawsCases=record.yaws_cases,
-            bcg=record.bcg,
-            dtp3=record.dtp3,
-            hepb3=record.hepb3,
-            hib3=record.hib3,
-            measles1=record.measles1,
-            polio3=record.polio3,
-            rotavirus=record.rotavirus,
-            rubella1=record.rubella1,
-            populationAge0=record.population_age0
-        )
+        return HealthRecordDTO.model_construct(**dict(zip(_HR_ALIASES, _hr_values(record))))
     
     @staticmethod
     def to_dto_list(records: List[HealthRecord]) -> List[HealthRecordDTO]:
         """Convert list of HealthRecords to DTOs"""
-        return [HealthRecordMapper.to_dto(r) for r in records]
+        construct = HealthRecordDTO.model_construct
+        return [
+            construct(**dict(zip(_HR_ALIASES, _hr_values(r))))
+            for r in records
+        ]
+    
+    @staticmethod
+    def to_dict_list(records: List[HealthRecord]) -> List[Dict[str, Any]]:
+        """Convert HealthRecords straight to HealthRecordDTO-shaped dicts (no Pydantic)"""
+        return [dict(zip(_HR_ALIASES, _hr_values(r))) for r in records]
 
 
 class HealthMetricsMapper:
@@ -80,37 +118,27 @@ class HealthMetricsMapper:
         if not metrics:
             return None
         
-        return HealthMetricsDTO(
-            diseaseCases=[
-                HealthMetricItemDTO(
-                    id=item.id,
-                    label=item.label,
-                    value=item.value,
-                    year=item.year,
-                    unit=item.unit,
-                    category=item.category
-                ) for item in metrics.disease_cases
-            ],
-            vaccinationCoverage=[
-                HealthMetricItemDTO(
-                    id=item.id,
-                    label=item.label,
-                    value=item.value,
-                    year=item.year,
-                    unit=item.unit,
-                    category=item.category
-                ) for item in metrics.vaccination_coverage
-            ],
-            population=[
-                HealthMetricItemDTO(
-                    id=item.id,
-                    label=item.label,
-                    value=item.value,
-                    year=item.year,
-                    unit=item.unit,
-                    category=item.category
-                ) for item in metrics.population
-            ],
+        construct = HealthMetricItemDTO.model_construct
+        
+        # Read the metric columns directly instead of materializing HealthMetricItems
+        def item_dtos(soa: HealthMetricsArray) -> List[HealthMetricItemDTO]:
+            ids, labels, units, categories = soa.metric_ids, soa.labels, soa.units, soa.categories
+            return [
+                construct(
+                    id=ids[code],
+                    label=labels[code],
+                    value=value,
+                    year=year,
+                    unit=units[code],
+                    category=categories[code]
+                )
+                for code, year, value in zip(soa.codes, soa.years, soa.values)
+            ]
+        
+        return HealthMetricsDTO.model_construct(
+            diseaseCases=item_dtos(metrics.disease_cases),
+            vaccinationCoverage=item_dtos(metrics.vaccination_coverage),
+            population=item_dtos(metrics.population),
             availableYears=metrics.available_years
         )
 
@@ -121,14 +149,14 @@ class EntityInfoMapper:
     @staticmethod
     def to_dto(entity_info: EntityInfo) -> EntityInfoDTO:
         """Convert EntityInfo to EntityInfoDTO"""
-        return EntityInfoDTO(
+        return EntityInfoDTO.model_construct(
             id=entity_info.id,
             label=entity_info.label,
             type=entity_info.type,
             description=entity_info.description,
             image=entity_info.image,
             attributes=[
-                EntityAttributeDTO(
+                EntityAttributeDTO.model_construct(
                     property=attr.property,
                     propertyLabel=attr.property_label,
                     value=attr.value,
@@ -139,7 +167,7 @@ class EntityInfoMapper:
             ],
             healthMetrics=HealthMetricsMapper.to_dto(entity_info.health_metrics),
             relatedEntities=[
-                RelatedEntityDTO(
+                RelatedEntityDTO.model_construct(
                     id=rel.id,
                     label=rel.label,
                     type=rel.type,
@@ -149,7 +177,7 @@ class EntityInfoMapper:
                 ) for rel in entity_info.related_entities
             ],
             sources=[
-                EntitySourceDTO(
+                EntitySourceDTO.model_construct(
                     name=src.name,
                     url=src.url,
                     date=src.date
@@ -164,7 +192,7 @@ class CountryCoordinatesMapper:
     @staticmethod
     def to_dto(coords: CountryCoordinates) -> CountryCoordinatesDTO:
         """Convert CountryCoordinates to CountryCoordinatesDTO"""
-        return CountryCoordinatesDTO(
+        return CountryCoordinatesDTO.model_construct(
             iso3Code=coords.iso3_code,
             label=coords.label,
             latitude=coords.latitude,
@@ -174,4 +202,12 @@ class CountryCoordinatesMapper:
     @staticmethod
     def to_dto_list(coords_list: List[CountryCoordinates]) -> List[CountryCoordinatesDTO]:
         """Convert list of CountryCoordinates to DTOs"""
-        return [CountryCoordinatesMapper.to_dto(c) for c in coords_list]
+        construct = CountryCoordinatesDTO.model_construct
+        return [
+            construct(
+                iso3Code=c.iso3_code,
+                label=c.label,
+                latitude=c.latitude,
+                longitude=c.longitude
+            ) for c in coords_list
+        ]
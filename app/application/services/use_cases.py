@@ -3,20 +3,96 @@ Application Services (Use Cases)
 Following Single Responsibility Principle
 Each service handles one specific business capability
 """
-from typing import List, Optional, Tuple
+import asyncio
+import re
+from operator import attrgetter
+from typing import List, Optional, Sequence, Tuple
 from app.domain.models import (
     Entity, EntityInfo, HealthRecord, CountryCoordinates, 
-    SPARQLQueryResult, EntityType, HealthMetrics, HealthMetricItem
+    SPARQLQueryResult, EntityType, HealthMetrics, HealthMetricsArray
 )
 from app.domain.repositories import (
     IEntityRepository, IEntityInfoRepository, IHealthRecordRepository,
-    IMapRepository, ISPARQLRepository
+    IMapRepository, ISPARQLRepository, ResultStream
 )
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Trailing solution modifier that already limits a SPARQL query
+_LIMIT_RE = re.compile(r"\bLIMIT\s+\d+(?:\s+OFFSET\s+\d+)?\s*$", re.IGNORECASE)
+
+
+def _apply_limit(query: str, limit: Optional[int]) -> str:
+    """Append LIMIT if specified and the query does not already end with one"""
+    if limit and not _LIMIT_RE.search(query):
+        return f"{query.rstrip()} LIMIT {limit}"
+    return query
+
+
+# Shared result for short suggestion queries; callers must not mutate it
+_EMPTY: List[Entity] = []
+
+# Health metric descriptors: (record attribute, metric id, label, unit)
+_DISEASE_FIELDS = (
+    ("hiv_cases", "hivCases", "HIV/AIDS Cases", "cases"),
+    ("malaria_cases", "malariaCases", "Malaria Cases", "cases"),
+    ("tuberculosis_cases", "tuberculosisCases", "Tuberculosis Cases", "cases"),
+    ("rabies_cases", "rabiesCases", "Rabies Cases", "cases"),
+    ("cholera_cases", "choleraCases", "Cholera Cases", "cases"),
+)
+
+_VACCINE_FIELDS = (
+    ("bcg", "bcg", "BCG", "children"),
+    ("dtp3", "dtp3", "DTP3", "children"),
+    ("hepb3", "hepb3", "HepB3", "children"),
+    ("hib3", "hib3", "Hib3", "children"),
+    ("measles1", "measles1", "Measles (1st dose)", "children"),
+    ("polio3", "polio3", "Polio (3rd dose)", "children"),
+    ("rotavirus", "rotavirus", "Rotavirus (last dose)", "children"),
+    ("rubella1", "rubella1", "Rubella (1st dose)", "children"),
+)
+
+_POP_FIELDS = (
+    ("population_age0", "populationAge0", "Population Age 0", "people"),
+)
+
+# Record attributes that count as data for a year but are not reported as metrics
+_UNLISTED_METRIC_ATTRS = ("guineaworm", "polio_cases", "smallpox_cases", "yaws_cases")
+
+# Record attributes of every reported metric, in _CATEGORY_METRICS order
+_METRIC_ATTRS = tuple(
+    attr for fields in (_DISEASE_FIELDS, _VACCINE_FIELDS, _POP_FIELDS) for attr, *_ in fields
+)
+
+# (metric id, label, unit, category) per metric, grouped by category in output order
+_CATEGORY_METRICS = tuple(
+    tuple((metric_id, metric_label, unit, category) for _, metric_id, metric_label, unit in fields)
+    for category, fields in (
+        ("disease", _DISEASE_FIELDS),
+        ("vaccination", _VACCINE_FIELDS),
+        ("population", _POP_FIELDS),
+    )
+)
+
+# (category index, metric code) for each value returned by _metric_values
+_METRIC_SLOTS = tuple(
+    (index, code)
+    for index, metrics in enumerate(_CATEGORY_METRICS)
+    for code in range(len(metrics))
+)
+
+# Fetch every metric value of a record in one C-level call
+_metric_values = attrgetter(*_METRIC_ATTRS)
+
+# Year of a record, used to find the earliest year for the available-years mask
+_record_year = attrgetter("year")
+
+# All HealthRecord metric attributes, used to decide whether a year has data
+_record_metric_values = attrgetter(*_METRIC_ATTRS, *_UNLISTED_METRIC_ATTRS)
+
+
 class SearchService:
     """
     Search service following Single Responsibility Principle
@@ -52,9 +128,7 @@ class SearchService:
     
     async def get_suggestions(self, query: str, limit: int = 10) -> List[Entity]:
         """Get autocomplete suggestions"""
-        if len(query) < 2:
-            return []
-        return await self.entity_repo.get_suggestions(query, limit)
+        return _EMPTY if len(query) < 2 else await self.entity_repo.get_suggestions(query, limit)
 
 
 class EntityInfoService:
@@ -73,44 +147,26 @@ class EntityInfoService:
     
     async def get_entity_info(self, entity_id: str) -> Optional[EntityInfo]:
         """Get complete entity information with health metrics"""
-        entity_info = await self.entity_info_repo.get_entity_info(entity_id)
+        # Entity info and health records are independent; fetch them concurrently
+        entity_info, health_metrics = await asyncio.gather(
+            self.entity_info_repo.get_entity_info(entity_id),
+            self._get_health_metrics(entity_id)
+        )
         
         if not entity_info:
             return None
         
         # Enrich with health metrics
-        health_metrics = await self._get_health_metrics(entity_id)
         entity_info.health_metrics = health_metrics
         
         return entity_info
     
     async def get_entity_info_by_label(self, label: str) -> Optional[EntityInfo]:
         """Get entity info by label (search-based)"""
-        # Search for entity by label
-        from app.domain.repositories import IEntityRepository
-        
-        # Try to find entity with exact label match
-        sparql_query = f"""
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT ?entity ?label WHERE {{
-            ?entity rdfs:label ?label .
-            FILTER(LCASE(?label) = LCASE("{label}"))
-        }}
-        LIMIT 1
-        """
-        
-        from app.infrastructure.repositories.graphdb_repository import GraphDBClient
-        from app.infrastructure.config.settings import settings
-        
-        client = GraphDBClient(settings.sparql_endpoint)
-        results = await client.query(sparql_query)
-        
-        if not results["results"]["bindings"]:
+        entity_uri = await self.entity_info_repo.find_entity_by_label(label)
+        if entity_uri is None:
             return None
         
-        entity_uri = results["results"]["bindings"][0]["entity"]["value"]
-        
         # Get full entity info
         return await self.get_entity_info(entity_uri)
     
@@ -126,182 +182,47 @@ class EntityInfoService:
         """Get and organize health metrics for entity"""
         try:
             records = await self.health_record_repo.get_by_location(entity_id)
-            
-            if not records:
-                return None
-            
-            disease_cases = []
-            vaccination_coverage = []
-            population_metrics = []
-            years = set()
-            
-            for record in records:
-                # Only add year if it has at least one non-null metric
-                has_data = any([
-                    record.hiv_cases, record.malaria_cases, record.tuberculosis_cases,
-                    record.rabies_cases, record.cholera_cases, record.guineaworm,
-                    record.polio_cases, record.smallpox_cases, record.yaws_cases,
-                    record.bcg, record.dtp3, record.hepb3, record.hib3,
-                    record.measles1, record.polio3, record.rotavirus, record.rubella1,
-                    record.population_age0
-                ])
-                
-                if has_data:
-                    years.add(record.year)
-                
-                # Disease cases
-                if record.hiv_cases is not None:
-                    disease_cases.append(HealthMetricItem(
-                        id="hivCases",
-                        label="HIV/AIDS Cases",
-                        value=record.hiv_cases,
-                        year=record.year,
-                        unit="cases",
-                        category="disease"
-                    ))
-                
-                if record.malaria_cases is not None:
-                    disease_cases.append(HealthMetricItem(
-                        id="malariaCases",
-                        label="Malaria Cases",
-                        value=record.malaria_cases,
-                        year=record.year,
-                        unit="cases",
-                        category="disease"
-                    ))
-                
-                if record.tuberculosis_cases is not None:
-                    disease_cases.append(HealthMetricItem(
-                        id="tuberculosisCases",
-                        label="Tuberculosis Cases",
-                        value=record.tuberculosis_cases,
-                        year=record.year,
-                        unit="cases",
-                        category="disease"
-                    ))
-                
-                if record.rabies_cases is not None:
-                    disease_cases.append(HealthMetricItem(
-                        id="rabiesCases",
-                        label="Rabies Cases",
-                        value=record.rabies_cases,
-                        year=record.year,
-                        unit="cases",
-                        category="disease"
-                    ))
-                
-                if record.cholera_cases is not None:
-                    disease_cases.append(HealthMetricItem(
-                        id="choleraCases",
-                        label="Cholera Cases",
-                        value=record.cholera_cases,
-                        year=record.year,
-                        unit="cases",
-                        category="disease"
-                    ))
-                
-                # Vaccination coverage
-                if record.bcg is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="bcg",
-                        label="BCG",
-                        value=record.bcg,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.dtp3 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="dtp3",
-                        label="DTP3",
-                        value=record.dtp3,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.hepb3 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="hepb3",
-                        label="HepB3",
-                        value=record.hepb3,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.hib3 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="hib3",
-                        label="Hib3",
-                        value=record.hib3,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.measles1 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="measles1",
-                        label="Measles (1st dose)",
-                        value=record.measles1,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.polio3 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="polio3",
-                        label="Polio (3rd dose)",
-                        value=record.polio3,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.rotavirus is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="rotavirus",
-                        label="Rotavirus (last dose)",
-                        value=record.rotavirus,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                if record.rubella1 is not None:
-                    vaccination_coverage.append(HealthMetricItem(
-                        id="rubella1",
-                        label="Rubella (1st dose)",
-                        value=record.rubella1,
-                        year=record.year,
-                        unit="children",
-                        category="vaccination"
-                    ))
-                
-                # Population
-                if record.population_age0 is not None:
-                    population_metrics.append(HealthMetricItem(
-                        id="populationAge0",
-                        label="Population Age 0",
-                        value=record.population_age0,
-                        year=record.year,
-                        unit="people",
-                        category="population"
-                    ))
-            
-            return HealthMetrics(
-                disease_cases=disease_cases,
-                vaccination_coverage=vaccination_coverage,
-                population=population_metrics,
-                available_years=sorted(list(years), reverse=True)  # Descending order (newest first)
-            )
+            return self._build_health_metrics(records)
         
         except Exception as e:
             logger.error(f"Error getting health metrics: {e}")
             return None
+    
+    @staticmethod
+    def _build_health_metrics(records: List[HealthRecord]) -> Optional[HealthMetrics]:
+        """Group health records into metrics per category"""
+        if not records:
+            return None
+        
+        columns = [HealthMetricsArray.for_metrics(metrics) for metrics in _CATEGORY_METRICS]
+        slots = [(columns[index].append, code) for index, code in _METRIC_SLOTS]
+        # Offset the mask by the earliest year; parsed records are not range-checked
+        year_base = min(map(_record_year, records))
+        year_mask = 0  # bit i set => year year_base + i has data
+        
+        for record in records:
+            year = record.year
+            
+            # Only add year if it has at least one non-null metric
+            if any(_record_metric_values(record)):
+                year_mask |= 1 << (year - year_base)
+            
+            # Only code, year and value are stored per value; metadata lives once per metric
+            for (append, code), value in zip(slots, _metric_values(record)):
+                if value is not None:
+                    append(code, year, value)
+        
+        disease, vaccination, population = columns
+        return HealthMetrics(
+            disease_cases=disease,
+            vaccination_coverage=vaccination,
+            population=population,
+            available_years=[  # Descending order (newest first)
+                year_base + i
+                for i in range(year_mask.bit_length() - 1, -1, -1)
+                if year_mask >> i & 1
+            ]
+        )
 
 
 class HealthRecordService:
@@ -328,10 +249,17 @@ class MapService:
     
     def __init__(self, map_repo: IMapRepository):
         self.map_repo = map_repo
+        self._coords_cache: Optional[Sequence[CountryCoordinates]] = None
     
-    async def get_all_country_coordinates(self) -> List[CountryCoordinates]:
-        """Get coordinates for all countries"""
-        return await self.map_repo.get_all_country_coordinates()
+    async def get_all_country_coordinates(self) -> Sequence[CountryCoordinates]:
+        """Get coordinates for all countries (cached after first call)"""
+        if self._coords_cache is None:
+            self._coords_cache = await self.map_repo.get_all_country_coordinates()
+        return self._coords_cache
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached country coordinates"""
+        self._coords_cache = None
     
     async def get_country_info(self, iso3_code: str) -> Optional[Entity]:
         """Get country information by ISO3 code"""
@@ -343,6 +271,7 @@ class SPARQLQueryService:
     
     def __init__(self, sparql_repo: ISPARQLRepository):
         self.sparql_repo = sparql_repo
+        self._sample_queries_cache: Optional[Sequence[str]] = None
     
     async def execute_query(
         self,
@@ -350,16 +279,41 @@ class SPARQLQueryService:
         limit: Optional[int] = None
     ) -> SPARQLQueryResult:
         """Execute SPARQL query"""
-        # Apply limit if specified
-        if limit:
-            query = f"{query.rstrip()} LIMIT {limit}"
+        return await self.sparql_repo.execute_query(_apply_limit(query, limit))
+    
+    async def stream_query(
+        self,
+        query: str,
+        limit: Optional[int] = None
+    ) -> ResultStream:
+        """Execute SPARQL query, returning the SPARQL JSON result in chunks"""
+        return await self.sparql_repo.stream_query(_apply_limit(query, limit))
+    
+    async def execute_batch(
+        self,
+        queries: List[str],
+        limit: Optional[int] = None,
+        concurrency: int = 32
+    ) -> List[SPARQLQueryResult]:
+        """Execute several SPARQL queries concurrently, results in input order"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(query: str) -> SPARQLQueryResult:
+            async with semaphore:
+                return await self.execute_query(query, limit)
         
-        return await self.sparql_repo.execute_query(query)
+        return list(await asyncio.gather(*(run(q) for q in queries)))
     
     async def validate_query(self, query: str) -> Tuple[bool, Optional[str]]:
         """Validate SPARQL query"""
         return await self.sparql_repo.validate_query(query)
     
-    async def get_sample_queries(self) -> List[str]:
-        """Get sample queries"""
-        return await self.sparql_repo.get_sample_queries()
+    async def get_sample_queries(self) -> Sequence[str]:
+        """Get sample queries (cached after first call)"""
+        if self._sample_queries_cache is None:
+            self._sample_queries_cache = await self.sparql_repo.get_sample_queries()
+        return self._sample_queries_cache
+    
+    def invalidate_cache(self) -> None:
+        """Drop cached sample queries"""
+        self._sample_queries_cache = None
@@ -1,33 +1,70 @@
 """
 Country coordinates data
 Matches the frontend's country-coordinates.ts
+
+Stored column-wise (struct of arrays); the immutable COUNTRY_COORDINATES
+tuple is only built when first accessed
 """
+from array import array
+from typing import Dict, Tuple
 from app.domain.models import CountryCoordinates
 
-COUNTRY_COORDINATES = [
-    CountryCoordinates(iso3_code="IDN", label="Indonesia", latitude=-0.7893, longitude=113.9213),
-    CountryCoordinates(iso3_code="IND", label="India", latitude=20.5937, longitude=78.9629),
-    CountryCoordinates(iso3_code="BRA", label="Brazil", latitude=-14.2350, longitude=-51.9253),
-    CountryCoordinates(iso3_code="USA", label="United States", latitude=37.0902, longitude=-95.7129),
-    CountryCoordinates(iso3_code="CHN", label="China", latitude=35.8617, longitude=104.1954),
-    CountryCoordinates(iso3_code="RUS", label="Russia", latitude=61.5240, longitude=105.3188),
-    CountryCoordinates(iso3_code="JPN", label="Japan", latitude=36.2048, longitude=138.2529),
-    CountryCoordinates(iso3_code="DEU", label="Germany", latitude=51.1657, longitude=10.4515),
-    CountryCoordinates(iso3_code="GBR", label="United Kingdom", latitude=55.3781, longitude=-3.4360),
-    CountryCoordinates(iso3_code="FRA", label="France", latitude=46.2276, longitude=2.2137),
-    CountryCoordinates(iso3_code="ITA", label="Italy", latitude=41.8719, longitude=12.5674),
-    CountryCoordinates(iso3_code="CAN", label="Canada", latitude=56.1304, longitude=-106.3468),
-    CountryCoordinates(iso3_code="AUS", label="Australia", latitude=-25.2744, longitude=133.7751),
-    CountryCoordinates(iso3_code="MEX", label="Mexico", latitude=23.6345, longitude=-102.5528),
-    CountryCoordinates(iso3_code="ARG", label="Argentina", latitude=-38.4161, longitude=-63.6167),
-    CountryCoordinates(iso3_code="ZAF", label="South Africa", latitude=-30.5595, longitude=22.9375),
-    CountryCoordinates(iso3_code="EGY", label="Egypt", latitude=26.8206, longitude=30.8025),
-    CountryCoordinates(iso3_code="NGA", label="Nigeria", latitude=9.0820, longitude=8.6753),
-    CountryCoordinates(iso3_code="KEN", label="Kenya", latitude=-0.0236, longitude=37.9062),
-    CountryCoordinates(iso3_code="ETH", label="Ethiopia", latitude=9.1450, longitude=40.4897),
-    CountryCoordinates(iso3_code="THA", label="Thailand", latitude=15.8700, longitude=100.9925),
-    CountryCoordinates(iso3_code="VNM", label="Vietnam", latitude=14.0583, longitude=108.2772),
-    CountryCoordinates(iso3_code="PHL", label="Philippines", latitude=12.8797, longitude=121.7740),
-    CountryCoordinates(iso3_code="PAK", label="Pakistan", latitude=30.3753, longitude=69.3451),
-    CountryCoordinates(iso3_code="BGD", label="Bangladesh", latitude=23.6850, longitude=90.3563),
-]
+_COUNTRIES = (
+    ("IDN", "Indonesia", -0.7893, 113.9213),
+    ("IND", "India", 20.5937, 78.9629),
+    ("BRA", "Brazil", -14.2350, -51.9253),
+    ("USA", "United States", 37.0902, -95.7129),
+    ("CHN", "China", 35.8617, 104.1954),
+    ("RUS", "Russia", 61.5240, 105.3188),
+    ("JPN", "Japan", 36.2048, 138.2529),
+    ("DEU", "Germany", 51.1657, 10.4515),
+    ("GBR", "United Kingdom", 55.3781, -3.4360),
+    ("FRA", "France", 46.2276, 2.2137),
+    ("ITA", "Italy", 41.8719, 12.5674),
+    ("CAN", "Canada", 56.1304, -106.3468),
+    ("AUS", "Australia", -25.2744, 133.7751),
+    ("MEX", "Mexico", 23.6345, -102.5528),
+    ("ARG", "Argentina", -38.4161, -63.6167),
+    ("ZAF", "South Africa", -30.5595, 22.9375),
+    ("EGY", "Egypt", 26.8206, 30.8025),
+    ("NGA", "Nigeria", 9.0820, 8.6753),
+    ("KEN", "Kenya", -0.0236, 37.9062),
+    ("ETH", "Ethiopia", 9.1450, 40.4897),
+    ("THA", "Thailand", 15.8700, 100.9925),
+    ("VNM", "Vietnam", 14.0583, 108.2772),
+    ("PHL", "Philippines", 12.8797, 121.7740),
+    ("PAK", "Pakistan", 30.3753, 69.3451),
+    ("BGD", "Bangladesh", 23.6850, 90.3563),
+)
+
+ISO3_CODES = tuple(c[0] for c in _COUNTRIES)
+LABELS = tuple(c[1] for c in _COUNTRIES)
+LATITUDES = array("d", (c[2] for c in _COUNTRIES))
+LONGITUDES = array("d", (c[3] for c in _COUNTRIES))
+
+# ISO3 code -> row index into the columns above
+COORDS_BY_ISO3: Dict[str, int] = {code: i for i, code in enumerate(ISO3_CODES)}
+
+del _COUNTRIES
+
+
+def _build_country_coordinates() -> Tuple[CountryCoordinates, ...]:
+    """Build domain objects from the coordinate columns"""
+    return tuple(
+        CountryCoordinates(
+            iso3_code=code,
+            label=label,
+            latitude=lat,
+            longitude=lon
+        )
+        for code, label, lat, lon in zip(ISO3_CODES, LABELS, LATITUDES, LONGITUDES)
+    )
+
+
+def __getattr__(name: str):
+    """Lazily build COUNTRY_COORDINATES on first access"""
+    if name == "COUNTRY_COORDINATES":
+        coordinates = _build_country_coordinates()
+        globals()["COUNTRY_COORDINATES"] = coordinates
+        return coordinates
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
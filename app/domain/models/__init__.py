@@ -8,7 +8,6 @@ from app.domain.models.entities import (
     HealthRecord,
     Property,
     HealthMetricItem,
-    HealthMetrics,
     EntityAttribute,
     RelatedEntity,
     EntitySource,
@@ -17,6 +16,7 @@ from app.domain.models.entities import (
     SPARQLBinding,
     SPARQLQueryResult,
 )
+from app.domain.models.health_metrics_soa import HealthMetrics, HealthMetricsArray
 
 __all__ = [
     "Entity",
@@ -32,4 +32,5 @@ __all__ = [
     "CountryCoordinates",
     "SPARQLBinding",
     "SPARQLQueryResult",
+    "HealthMetricsArray",
 ]
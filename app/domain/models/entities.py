@@ -1,16 +1,22 @@
 """
 Domain Models following Domain-Driven Design
 These are pure domain entities with business logic
+
+Constructors do not validate; use the validated() classmethods at trust
+boundaries
 """
 from dataclasses import dataclass, field
-from typing import Optional, List, Literal
+from typing import TYPE_CHECKING, Optional, List, Literal
 from datetime import datetime
 
+if TYPE_CHECKING:
+    from app.domain.models.health_metrics_soa import HealthMetrics
+
 
 EntityType = Literal["country", "region", "organization"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Entity:
     """Domain entity representing countries, regions, or organizations"""
     id: str
@@ -18,14 +24,18 @@ class Entity:
     type: EntityType
     iso3_code: Optional[str] = None
     
-    def __post_init__(self):
-        if not self.id:
+    @classmethod
+    def validated(cls, **kwargs) -> "Entity":
+        """Create an entity, validating it (use at trust boundaries)"""
+        entity = cls(**kwargs)
+        if not entity.id:
             raise ValueError("Entity ID cannot be empty")
-        if not self.label:
+        if not entity.label:
             raise ValueError("Entity label cannot be empty")
+        return entity
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthRecord:
     """Health data record for a specific location and year"""
     id: str
@@ -56,12 +66,16 @@ class HealthRecord:
     # Population
     population_age0: Optional[float] = None
     
-    def __post_init__(self):
-        if self.year < 1900 or self.year > 2100:
-            raise ValueError(f"Invalid year: {self.year}")
+    @classmethod
+    def validated(cls, **kwargs) -> "HealthRecord":
+        """Create a health record, validating it (use at trust boundaries)"""
+        record = cls(**kwargs)
+        if record.year < 1900 or record.year > 2100:
+            raise ValueError(f"Invalid year: {record.year}")
+        return record
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """RDF Property definition"""
     id: str
@@ -69,7 +83,7 @@ class Property:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthMetricItem:
     """Individual health metric with metadata"""
     id: str
@@ -80,16 +94,7 @@ class HealthMetricItem:
     category: Literal["disease", "vaccination", "population"] = "disease"
 
 
-@dataclass
-class HealthMetrics:
-    """Grouped health metrics for an entity"""
-    disease_cases: List[HealthMetricItem] = field(default_factory=list)
-    vaccination_coverage: List[HealthMetricItem] = field(default_factory=list)
-    population: List[HealthMetricItem] = field(default_factory=list)
-    available_years: List[int] = field(default_factory=list)
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntityAttribute:
     """Attribute of an entity with rich metadata"""
     property: str
@@ -100,7 +105,7 @@ class EntityAttribute:
     unit: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RelatedEntity:
     """Related entity with relationship information"""
     id: str
@@ -111,7 +116,7 @@ class RelatedEntity:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EntitySource:
     """Data source information"""
     name: str
@@ -119,7 +124,7 @@ class EntitySource:
     date: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityInfo:
     """Complete entity information for InfoBox"""
     id: str
@@ -128,12 +133,12 @@ class EntityInfo:
     description: Optional[str] = None
     image: Optional[str] = None
     attributes: List[EntityAttribute] = field(default_factory=list)
-    health_metrics: Optional[HealthMetrics] = None
+    health_metrics: Optional["HealthMetrics"] = None
     related_entities: List[RelatedEntity] = field(default_factory=list)
     sources: List[EntitySource] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CountryCoordinates:
     """Geographic coordinates for map display"""
     iso3_code: str
@@ -141,14 +146,18 @@ class CountryCoordinates:
     latitude: float
     longitude: float
     
-    def __post_init__(self):
-        if not (-90 <= self.latitude <= 90):
-            raise ValueError(f"Invalid latitude: {self.latitude}")
-        if not (-180 <= self.longitude <= 180):
-            raise ValueError(f"Invalid longitude: {self.longitude}")
-
-
-@dataclass
+    @classmethod
+    def validated(cls, **kwargs) -> "CountryCoordinates":
+        """Create coordinates, validating them (use at trust boundaries)"""
+        coords = cls(**kwargs)
+        if not (-90 <= coords.latitude <= 90):
+            raise ValueError(f"Invalid latitude: {coords.latitude}")
+        if not (-180 <= coords.longitude <= 180):
+            raise ValueError(f"Invalid longitude: {coords.longitude}")
+        return coords
+
+
+@dataclass(slots=True, frozen=True)
 class SPARQLBinding:
     """SPARQL query result binding"""
     var: str
@@ -158,7 +167,7 @@ class SPARQLBinding:
     lang: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SPARQLQueryResult:
     """SPARQL query result"""
     variables: List[str]
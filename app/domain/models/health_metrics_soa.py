@@ -0,0 +1,120 @@
+"""
+Column-wise health metrics
+Metric values are held as struct-of-arrays for aggregation over many values;
+HealthMetricItem objects are only built at the API boundary
+"""
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.domain.models.entities import HealthMetricItem
+
+# (metric id, label, unit, category) describing one metric
+MetricInfo = Tuple[str, str, Optional[str], str]
+
+
+@dataclass(slots=True)
+class HealthMetricsArray:
+    """Health metric values stored as parallel typed arrays"""
+    # Per-metric metadata, indexed by metric code
+    metric_ids: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    units: List[Optional[str]] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    
+    # Per-value columns
+    codes: array = field(default_factory=lambda: array("H"))
+    years: array = field(default_factory=lambda: array("i"))
+    values: array = field(default_factory=lambda: array("d"))
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    @classmethod
+    def for_metrics(cls, metrics: Iterable[MetricInfo]) -> "HealthMetricsArray":
+        """Empty columns with known metrics; codes follow the given order"""
+        soa = cls()
+        for metric_id, label, unit, category in metrics:
+            soa.metric_ids.append(metric_id)
+            soa.labels.append(label)
+            soa.units.append(unit)
+            soa.categories.append(category)
+        return soa
+    
+    def append(self, code: int, year: int, value: float) -> None:
+        """Add one value of the metric with the given code"""
+        self.codes.append(code)
+        self.years.append(year)
+        self.values.append(value)
+    
+    @classmethod
+    def from_items(cls, items: Iterable[HealthMetricItem]) -> "HealthMetricsArray":
+        """Build the columns from metric items in a single pass"""
+        soa = cls()
+        code_by_id: Dict[str, int] = {}
+        codes_append = soa.codes.append
+        years_append = soa.years.append
+        values_append = soa.values.append
+        
+        for item in items:
+            code = code_by_id.get(item.id)
+            if code is None:
+                code = code_by_id[item.id] = len(soa.metric_ids)
+                soa.metric_ids.append(item.id)
+                soa.labels.append(item.label)
+                soa.units.append(item.unit)
+                soa.categories.append(item.category)
+            codes_append(code)
+            years_append(item.year)
+            values_append(item.value)
+        
+        return soa
+    
+    def to_items(self) -> List[HealthMetricItem]:
+        """Materialize metric items (for API responses)"""
+        ids, labels, units, categories = self.metric_ids, self.labels, self.units, self.categories
+        return [
+            HealthMetricItem(ids[code], labels[code], value, year, units[code], categories[code])
+            for code, year, value in zip(self.codes, self.years, self.values)
+        ]
+    
+    def _code(self, metric_id: str) -> Optional[int]:
+        """Metric code for an id, or None if absent"""
+        try:
+            return self.metric_ids.index(metric_id)
+        except ValueError:
+            return None
+    
+    def mean_by_year(self, metric_id: str) -> Dict[int, float]:
+        """Mean value of one metric for each year"""
+        code = self._code(metric_id)
+        if code is None:
+            return {}
+        
+        sums: Dict[int, float] = {}
+        counts: Dict[int, int] = {}
+        for c, year, value in zip(self.codes, self.years, self.values):
+            if c == code:
+                sums[year] = sums.get(year, 0.0) + value
+                counts[year] = counts.get(year, 0) + 1
+        
+        return {year: total / counts[year] for year, total in sums.items()}
+    
+    def value_range(self, metric_id: str) -> Optional[Tuple[float, float]]:
+        """(min, max) of one metric across all years"""
+        code = self._code(metric_id)
+        if code is None:
+            return None
+        
+        selected = [value for c, value in zip(self.codes, self.values) if c == code]
+        if not selected:
+            return None
+        return min(selected), max(selected)
+
+
+@dataclass(slots=True)
+class HealthMetrics:
+    """Grouped health metrics for an entity"""
+    disease_cases: HealthMetricsArray = field(default_factory=HealthMetricsArray)
+    vaccination_coverage: HealthMetricsArray = field(default_factory=HealthMetricsArray)
+    population: HealthMetricsArray = field(default_factory=HealthMetricsArray)
+    available_years: List[int] = field(default_factory=list)
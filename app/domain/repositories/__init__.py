@@ -8,6 +8,7 @@ from app.domain.repositories.interfaces import (
     IHealthRecordRepository,
     IMapRepository,
     ISPARQLRepository,
+    ResultStream,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "IHealthRecordRepository",
     "IMapRepository",
     "ISPARQLRepository",
+    "ResultStream",
 ]
@@ -4,13 +4,21 @@ These are abstractions that domain/application layers depend on
 Infrastructure layer provides concrete implementations
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Protocol, Sequence
 from app.domain.models import (
     Entity, EntityInfo, HealthRecord, CountryCoordinates,
     SPARQLQueryResult, EntityType
 )
 
 
+class ResultStream(Protocol):
+    """Chunked query result holding a connection until aclose() is called"""
+    
+    def __aiter__(self) -> AsyncIterator[bytes]: ...
+    
+    async def aclose(self) -> None: ...
+
+
 class IEntityRepository(ABC):
     """
     Interface for entity operations
@@ -36,6 +44,11 @@ class IEntityRepository(ABC):
         """Get entity by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, entity_ids: List[str]) -> Dict[str, Entity]:
+        """Get several entities by ID in one lookup, keyed by ID"""
+        pass
+    
     @abstractmethod
     async def get_suggestions(self, query: str, limit: int = 10) -> List[Entity]:
         """Get autocomplete suggestions"""
@@ -63,6 +76,11 @@ class IEntityInfoRepository(ABC):
     ) -> List[Entity]:
         """Get entities related to given entity"""
         pass
+    
+    @abstractmethod
+    async def find_entity_by_label(self, label: str) -> Optional[str]:
+        """Find entity URI by exact (case-insensitive) label"""
+        pass
 
 
 class IHealthRecordRepository(ABC):
@@ -77,6 +95,15 @@ class IHealthRecordRepository(ABC):
         """Get health records for a location, optionally filtered by year"""
         pass
     
+    @abstractmethod
+    async def get_by_locations(
+        self,
+        location_ids: List[str],
+        year: Optional[int] = None
+    ) -> Dict[str, List[HealthRecord]]:
+        """Get health records for several locations in one round-trip, keyed by location"""
+        pass
+    
     @abstractmethod
     async def get_available_years(self, location_id: str) -> List[int]:
         """Get years with available data for a location"""
@@ -87,7 +114,7 @@ class IMapRepository(ABC):
     """Interface for map-related operations"""
     
     @abstractmethod
-    async def get_all_country_coordinates(self) -> List[CountryCoordinates]:
+    async def get_all_country_coordinates(self) -> Sequence[CountryCoordinates]:
         """Get coordinates for all countries"""
         pass
     
@@ -105,6 +132,14 @@ class ISPARQLRepository(ABC):
         """Execute SPARQL query against the knowledge graph"""
         pass
     
+    @abstractmethod
+    async def stream_query(self, query: str) -> ResultStream:
+        """
+        Execute SPARQL query, returning the SPARQL JSON result in chunks
+        The caller must aclose() the stream, even if it is never iterated
+        """
+        pass
+    
     @abstractmethod
     async def validate_query(self, query: str) -> tuple[bool, Optional[str]]:
         """
@@ -114,6 +149,6 @@ class ISPARQLRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_sample_queries(self) -> List[str]:
+    async def get_sample_queries(self) -> Sequence[str]:
         """Get sample SPARQL queries"""
         pass
@@ -1,11 +1,27 @@
 """
 Application Configuration following Single Responsibility Principle
 """
-from pydantic_settings import BaseSettings
-from typing import List
+import os
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Mapping, Optional, Tuple
+from dotenv import dotenv_values
 
+_TRUE_VALUES = frozenset(("1", "true", "t", "yes", "y", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "f", "no", "n", "off"))
 
-class Settings(BaseSettings):
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value"""
+    normalized = value.strip().lower()
+    if normalized in _TRUE_VALUES:
+        return True
+    if normalized in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+@dataclass(slots=True, frozen=True)
+class Settings:
     """Application settings from environment variables"""
     
     # GraphDB Configuration
@@ -24,6 +40,15 @@ class Settings(BaseSettings):
     cors_allow_methods: str = "*"
     cors_allow_headers: str = "*"
     
+    # SPARQL Configuration
+    sparql_pool_size: int = 16  # Max concurrent GraphDB connections; match its query threads
+    sparql_validate_on_server: bool = False
+    sparql_validate_timeout: float = 2.0
+    
+    # Search: use a GraphDB Lucene connector instead of scanning labels with CONTAINS
+    search_use_lucene: bool = False
+    search_lucene_index: str = "entityIndex"
+    
     # Logging
     log_level: str = "INFO"
     
@@ -34,15 +59,59 @@ class Settings(BaseSettings):
     wd_entity_ns: str = "http://www.wikidata.org/entity/"
     wd_property_ns: str = "http://www.wikidata.org/prop/direct/"
     
+    # Derived once from cors_origins
+    cors_origins_tuple: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "cors_origins_tuple",
+            tuple(origin.strip() for origin in self.cors_origins.split(","))
+        )
+    
     @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins string to list"""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    def cors_origins_list(self) -> Tuple[str, ...]:
+        """CORS origins parsed once at load time"""
+        return self.cors_origins_tuple
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    @classmethod
+    def from_env(
+        cls,
+        environ: Optional[Mapping[str, str]] = None,
+        env_file: Optional[str] = ".env"
+    ) -> "Settings":
+        """
+        Load settings once from the environment and an optional .env file
+        Names are case-insensitive; process environment overrides the .env file
+        """
+        values: Dict[str, Any] = {}
+        if env_file and os.path.isfile(env_file):
+            values.update(
+                (key.lower(), value)
+                for key, value in dotenv_values(env_file).items()
+                if value is not None
+            )
+        values.update(
+            (key.lower(), value)
+            for key, value in (os.environ if environ is None else environ).items()
+        )
+        
+        kwargs: Dict[str, Any] = {}
+        for f in fields(cls):
+            if not f.init or f.name not in values:
+                continue
+            raw = values[f.name]
+            if f.type is bool or f.type == "bool":
+                kwargs[f.name] = _parse_bool(raw)
+            elif f.type is int or f.type == "int":
+                kwargs[f.name] = int(raw)
+            elif f.type is float or f.type == "float":
+                kwargs[f.name] = float(raw)
+            else:
+                kwargs[f.name] = raw
+        
+        return cls(**kwargs)
 
 
 # Singleton instance
-settings = Settings()
+settings = Settings.from_env()
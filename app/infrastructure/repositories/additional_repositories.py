@@ -2,16 +2,54 @@
 Additional GraphDB Repository Implementations
 Health Records, Map, and SPARQL repositories
 """
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from app.domain.models import HealthRecord, CountryCoordinates, Entity, SPARQLQueryResult
 from app.domain.repositories import IHealthRecordRepository, IMapRepository, ISPARQLRepository
 from app.infrastructure.config.settings import settings
-from app.infrastructure.repositories.graphdb_repository import GraphDBClient
-from app.data.country_coordinates import COUNTRY_COORDINATES
+from app.infrastructure.repositories.graphdb_repository import (
+    PREFIXES, GraphDBClient, SPARQLResultStream
+)
+from app.infrastructure.repositories.sparql_terms import iri, string_literal
+from app.data import country_coordinates
+from rdflib.plugins.sparql.parser import parseQuery
 import logging
+import sys
+from dataclasses import fields
 
 logger = logging.getLogger(__name__)
 
+# SPARQL variable / kgp: property name -> HealthRecord field, built once at import
+_SPARQL_KEY_TO_FIELD = {
+    "hivCases": "hiv_cases",
+    "malariaCases": "malaria_cases",
+    "rabiesCases": "rabies_cases",
+    "tuberculosisCases": "tuberculosis_cases",
+    "choleraCases": "cholera_cases",
+    "guineaworm": "guineaworm",
+    "polioCases": "polio_cases",
+    "smallpoxCases": "smallpox_cases",
+    "yawsCases": "yaws_cases",
+    "bcg": "bcg",
+    "dtp3": "dtp3",
+    "hepb3": "hepb3",
+    "hib3": "hib3",
+    "measles1": "measles1",
+    "polio3": "polio3",
+    "rotavirus": "rotavirus",
+    "rubella1": "rubella1",
+    "populationAge0": "population_age0",
+}
+_SPARQL_KEY_TO_FIELD = {sys.intern(k): sys.intern(v) for k, v in _SPARQL_KEY_TO_FIELD.items()}
+
+# HealthRecord metric field -> positional constructor index; the metrics are
+# the fields following id, location and year
+_METRIC_FIELD_SLOTS = {
+    f.name: i for i, f in enumerate(fields(HealthRecord)) if f.name in _SPARQL_KEY_TO_FIELD.values()
+}
+
+# kgp: properties holding health metrics, as a SPARQL VALUES block body
+_HEALTH_PREDICATES_VALUES = " ".join(f"kgp:{name}" for name in _SPARQL_KEY_TO_FIELD)
+
 
 class HealthRecordRepository(IHealthRecordRepository):
     """Health record repository implementation"""
@@ -20,6 +58,39 @@ class HealthRecordRepository(IHealthRecordRepository):
         self.client = graphdb_client
         self.kgr_ns = settings.kg_record_ns
         self.kgp_ns = settings.kg_property_ns
+        # Full predicate IRI -> positional HealthRecord argument index
+        self._predicate_slots = {
+            sys.intern(self.kgp_ns + key): _METRIC_FIELD_SLOTS[field]
+            for key, field in _SPARQL_KEY_TO_FIELD.items()
+        }
+        
+        # Constant parts of each query are built once; per-call values are
+        # bound through VALUES so the query skeleton never changes
+        # One row per (record, metric) pair; grouped back into records client-side.
+        # {locations} holds one or more IRIs
+        self._by_location_tmpl = PREFIXES + """
+        SELECT ?loc ?record ?year ?p ?v
+        WHERE {{
+            VALUES ?loc {{ {locations} }}
+            ?record schema:location ?loc ;
+                    schema:year ?year .
+            {year_filter}
+            
+            OPTIONAL {{
+                ?record ?p ?v .
+                VALUES ?p {{ """ + _HEALTH_PREDICATES_VALUES + """ }}
+            }}
+        }}
+        ORDER BY DESC(?year)
+        """
+        self._years_tmpl = PREFIXES + """
+        SELECT DISTINCT ?year WHERE {{
+            VALUES ?loc {{ {location} }}
+            ?record schema:location ?loc ;
+                    schema:year ?year .
+        }}
+        ORDER BY DESC(?year)
+        """
     
     async def get_by_location(
         self,
@@ -28,108 +99,66 @@ class HealthRecordRepository(IHealthRecordRepository):
     ) -> List[HealthRecord]:
         """Get health records for a location"""
         
-        year_filter = f'FILTER(STR(?year) = "{year}")' if year else ""
+        return await self._fetch_records(iri(location_id), year)
+    
+    async def get_by_locations(
+        self,
+        location_ids: List[str],
+        year: Optional[int] = None
+    ) -> Dict[str, List[HealthRecord]]:
+        """Get health records for several locations in one query, keyed by location"""
+        by_location: Dict[str, List[HealthRecord]] = {lid: [] for lid in location_ids}
+        if not by_location:
+            return by_location
         
-        sparql_query = f"""
-        PREFIX kgp: <{self.kgp_ns}>
-        PREFIX schema: <http://schema.org/>
+        records = await self._fetch_records(" ".join(map(iri, by_location)), year)
+        for record in records:
+            by_location.setdefault(record.location, []).append(record)
         
-        SELECT ?record ?year 
-               ?hivCases ?malariaCases ?rabiesCases ?tuberculosisCases 
-               ?choleraCases ?guineaworm ?polioCases ?smallpoxCases ?yawsCases
-               ?bcg ?dtp3 ?hepb3 ?hib3 ?measles1 ?polio3 ?rotavirus ?rubella1
-               ?populationAge0
-        WHERE {{
-            ?record schema:location <{location_id}> ;
-                    schema:year ?year .
-            {year_filter}
-            
-            OPTIONAL {{ ?record kgp:hivCases ?hivCases . }}
-            OPTIONAL {{ ?record kgp:malariaCases ?malariaCases . }}
-            OPTIONAL {{ ?record kgp:rabiesCases ?rabiesCases . }}
-            OPTIONAL {{ ?record kgp:tuberculosisCases ?tuberculosisCases . }}
-            OPTIONAL {{ ?record kgp:choleraCases ?choleraCases . }}
-            OPTIONAL {{ ?record kgp:guineaworm ?guineaworm . }}
-            OPTIONAL {{ ?record kgp:polioCases ?polioCases . }}
-            OPTIONAL {{ ?record kgp:smallpoxCases ?smallpoxCases . }}
-            OPTIONAL {{ ?record kgp:yawsCases ?yawsCases . }}
-            OPTIONAL {{ ?record kgp:bcg ?bcg . }}
-            OPTIONAL {{ ?record kgp:dtp3 ?dtp3 . }}
-            OPTIONAL {{ ?record kgp:hepb3 ?hepb3 . }}
-            OPTIONAL {{ ?record kgp:hib3 ?hib3 . }}
-            OPTIONAL {{ ?record kgp:measles1 ?measles1 . }}
-            OPTIONAL {{ ?record kgp:polio3 ?polio3 . }}
-            OPTIONAL {{ ?record kgp:rotavirus ?rotavirus . }}
-            OPTIONAL {{ ?record kgp:rubella1 ?rubella1 . }}
-            OPTIONAL {{ ?record kgp:populationAge0 ?populationAge0 . }}
-        }}
-        ORDER BY DESC(?year)
-        """
+        return by_location
+    
+    async def _fetch_records(self, locations: str, year: Optional[int]) -> List[HealthRecord]:
+        """Run the records query for a VALUES list of location IRIs"""
+        year_filter = f'FILTER(STR(?year) = "{year}")' if year else ""
+        sparql_query = self._by_location_tmpl.format_map({
+            "locations": locations,
+            "year_filter": year_filter,
+        })
         
         results = await self.client.query(sparql_query)
         return self._parse_health_records(results)
     
     async def get_available_years(self, location_id: str) -> List[int]:
         """Get years with available data"""
-        sparql_query = f"""
-        PREFIX schema: <http://schema.org/>
-        
-        SELECT DISTINCT ?year WHERE {{
-            ?record schema:location <{location_id}> ;
-                    schema:year ?year .
-        }}
-        ORDER BY DESC(?year)
-        """
+        sparql_query = self._years_tmpl.format_map({"location": iri(location_id)})
         
         results = await self.client.query(sparql_query)
-        years = []
-        for binding in results["results"]["bindings"]:
-            year_str = binding["year"]["value"]
-            years.append(int(year_str))
-        
-        return years
+        return [int(binding["year"]["value"]) for binding in results["results"]["bindings"]]
     
     def _parse_health_records(self, results: Dict[str, Any]) -> List[HealthRecord]:
-        """Parse SPARQL results to HealthRecord objects"""
-        records = []
+        """
+        Parse (record, predicate, value) rows into HealthRecord objects
+        Each record is filled as a positional row (id, location, year, *metrics)
+        in one pass; a malformed numeric literal raises instead of being dropped
+        """
+        slots = self._predicate_slots
+        empty_metrics = [None] * len(_METRIC_FIELD_SLOTS)
+        rows: Dict[str, list] = {}
         
         for binding in results["results"]["bindings"]:
-            record = HealthRecord(
-                id=binding["record"]["value"],
-                location=binding.get("location", {}).get("value", ""),
-                year=int(binding["year"]["value"]),
-                hiv_cases=self._get_float(binding, "hivCases"),
-                malaria_cases=self._get_float(binding, "malariaCases"),
-                rabies_cases=self._get_float(binding, "rabiesCases"),
-                tuberculosis_cases=self._get_float(binding, "tuberculosisCases"),
-                cholera_cases=self._get_float(binding, "choleraCases"),
-                guineaworm=self._get_float(binding, "guineaworm"),
-                polio_cases=self._get_float(binding, "polioCases"),
-                smallpox_cases=self._get_float(binding, "smallpoxCases"),
-                yaws_cases=self._get_float(binding, "yawsCases"),
-                bcg=self._get_float(binding, "bcg"),
-                dtp3=self._get_float(binding, "dtp3"),
-                hepb3=self._get_float(binding, "hepb3"),
-                hib3=self._get_float(binding, "hib3"),
-                measles1=self._get_float(binding, "measles1"),
-                polio3=self._get_float(binding, "polio3"),
-                rotavirus=self._get_float(binding, "rotavirus"),
-                rubella1=self._get_float(binding, "rubella1"),
-                population_age0=self._get_float(binding, "populationAge0")
-            )
-            records.append(record)
+            record_id = binding["record"]["value"]
+            row = rows.get(record_id)
+            if row is None:
+                location = binding["loc"]["value"] if "loc" in binding else ""
+                row = rows[record_id] = [
+                    record_id, location, int(binding["year"]["value"]), *empty_metrics
+                ]
+            if "p" in binding:
+                slot = slots.get(binding["p"]["value"])
+                if slot is not None:
+                    row[slot] = float(binding["v"]["value"])
         
-        return records
-    
-    @staticmethod
-    def _get_float(binding: dict, key: str) -> Optional[float]:
-        """Safely extract float value from binding"""
-        if key in binding:
-            try:
-                return float(binding[key]["value"])
-            except (ValueError, KeyError):
-                return None
-        return None
+        return [HealthRecord(*row) for row in rows.values()]
 
 
 class MapRepository(IMapRepository):
@@ -139,61 +168,22 @@ class MapRepository(IMapRepository):
         self.client = graphdb_client
         self.wdt_ns = settings.wd_property_ns
         self.kgp_ns = settings.kg_property_ns
-    
-    async def get_all_country_coordinates(self) -> List[CountryCoordinates]:
-        """Get coordinates for all countries from GraphDB"""
-        sparql_query = f"""
-        PREFIX kgp: <{self.kgp_ns}>
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
         
-        SELECT DISTINCT ?entity ?label ?iso3Code ?latitude ?longitude WHERE {{
-            ?entity kgp:latitude ?latitude ;
-                    kgp:longitude ?longitude ;
+        self._by_iso3_tmpl = PREFIXES + """
+        SELECT ?entity ?label WHERE {{
+            VALUES ?code {{ {code} }}
+            ?entity wdt:P298 ?code ;
                     rdfs:label ?label .
-            OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
         }}
         """
-        
-        results = await self.client.query(sparql_query)
-        coordinates = []
-        
-        for binding in results["results"]["bindings"]:
-            entity_id = binding["entity"]["value"]
-            
-            # Extract Q-code or entity code
-            if "/entity/" in entity_id:
-                code = entity_id.split("/entity/")[-1]
-            else:
-                code = binding.get("iso3Code", {}).get("value", "")
-            
-            if not code:
-                continue
-                
-            try:
-                coordinates.append(CountryCoordinates(
-                    country_code=code,
-                    name=binding["label"]["value"],
-                    latitude=float(binding["latitude"]["value"]),
-                    longitude=float(binding["longitude"]["value"])
-                ))
-            except (ValueError, KeyError) as e:
-                logger.warning(f"Invalid coordinates for {code}: {e}")
-                continue
-        
-        return coordinates
+    
+    async def get_all_country_coordinates(self) -> Tuple[CountryCoordinates, ...]:
+        """Get coordinates for all countries (static data, shared immutable tuple)"""
+        return country_coordinates.COUNTRY_COORDINATES
     
     async def get_country_by_iso3(self, iso3_code: str) -> Optional[Entity]:
         """Get country entity by ISO3 code"""
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT ?entity ?label WHERE {{
-            ?entity wdt:P298 "{iso3_code}" ;
-                    rdfs:label ?label .
-        }}
-        """
+        sparql_query = self._by_iso3_tmpl.format_map({"code": string_literal(iso3_code)})
         
         results = await self.client.query(sparql_query)
         bindings = results["results"]["bindings"]
@@ -210,39 +200,10 @@ class MapRepository(IMapRepository):
         )
 
 
-class SPARQLRepository(ISPARQLRepository):
-    """SPARQL repository for direct query execution"""
-    
-    def __init__(self, graphdb_client: GraphDBClient):
-        self.client = graphdb_client
-    
-    async def execute_query(self, query: str) -> SPARQLQueryResult:
-        """Execute SPARQL query"""
-        results = await self.client.query(query)
-        
-        variables = results["head"]["vars"]
-        bindings = results["results"]["bindings"]
-        
-        return SPARQLQueryResult(
-            variables=variables,
-            bindings=bindings
-        )
-    
-    async def validate_query(self, query: str) -> tuple[bool, Optional[str]]:
-        """Validate SPARQL query syntax"""
-        try:
-            # Try to execute query with LIMIT 1 to validate
-            validation_query = f"{query.rstrip()} LIMIT 1"
-            await self.client.query(validation_query)
-            return True, None
-        except Exception as e:
-            return False, str(e)
-    
-    async def get_sample_queries(self) -> List[str]:
-        """Get sample SPARQL queries"""
-        return [
-            # Query 1: Countries with health data
-            """PREFIX kgp: <http://kg.gaung.org/property/>
+# Static sample queries shown in the SPARQL editor
+_SAMPLE_QUERIES: Tuple[str, ...] = (
+    # Query 1: Countries with health data
+    """PREFIX kgp: <http://kg.gaung.org/property/>
 PREFIX schema: <http://schema.org/>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
@@ -255,9 +216,9 @@ WHERE {
 GROUP BY ?country ?countryLabel
 ORDER BY DESC(?recordCount)
 LIMIT 10""",
-            
-            # Query 2: HIV cases by year
-            """PREFIX kgp: <http://kg.gaung.org/property/>
+
+    # Query 2: HIV cases by year
+    """PREFIX kgp: <http://kg.gaung.org/property/>
 PREFIX schema: <http://schema.org/>
 
 SELECT ?year (SUM(?cases) as ?totalCases)
@@ -268,9 +229,9 @@ WHERE {
 }
 GROUP BY ?year
 ORDER BY ?year""",
-            
-            # Query 3: Vaccination coverage
-            """PREFIX kgp: <http://kg.gaung.org/property/>
+
+    # Query 3: Vaccination coverage
+    """PREFIX kgp: <http://kg.gaung.org/property/>
 PREFIX schema: <http://schema.org/>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
@@ -287,9 +248,9 @@ WHERE {
 }
 ORDER BY DESC(?bcg)
 LIMIT 20""",
-            
-            # Query 4: All properties
-            """PREFIX kgp: <http://kg.gaung.org/property/>
+
+    # Query 4: All properties
+    """PREFIX kgp: <http://kg.gaung.org/property/>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
 SELECT ?property ?label ?description
@@ -298,5 +259,58 @@ WHERE {
               rdfs:label ?label .
     OPTIONAL { ?property rdfs:comment ?description . }
 }
-ORDER BY ?label"""
-        ]
+ORDER BY ?label""",
+)
+
+
+class SPARQLRepository(ISPARQLRepository):
+    """SPARQL repository for direct query execution"""
+    
+    def __init__(self, graphdb_client: GraphDBClient):
+        self.client = graphdb_client
+    
+    async def execute_query(self, query: str) -> SPARQLQueryResult:
+        """Execute SPARQL query"""
+        # Ad-hoc user queries bypass the shared result cache
+        results = await self.client.query(query, cache=False)
+        
+        variables = results["head"]["vars"]
+        bindings = results["results"]["bindings"]
+        
+        return SPARQLQueryResult(
+            variables=variables,
+            bindings=bindings
+        )
+    
+    async def stream_query(self, query: str) -> SPARQLResultStream:
+        """Execute SPARQL query, passing GraphDB's JSON body through unparsed"""
+        return await self.client.stream(query)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached query results (call after writes to the graph)"""
+        self.client.clear_cache()
+    
+    async def validate_query(self, query: str) -> tuple[bool, Optional[str]]:
+        """
+        Validate SPARQL query syntax
+        Parsed locally; the GraphDB round-trip only runs when server-side
+        validation is enabled in settings
+        """
+        try:
+            parseQuery(query)
+        except Exception as e:
+            return False, str(e)
+        
+        if not settings.sparql_validate_on_server:
+            return True, None
+        
+        try:
+            # The query is sent unmodified; only the response headers are awaited
+            error = await self.client.check_syntax(query, settings.sparql_validate_timeout)
+        except Exception as e:
+            return False, str(e)
+        return error is None, error
+    
+    async def get_sample_queries(self) -> Tuple[str, ...]:
+        """Get sample SPARQL queries"""
+        return _SAMPLE_QUERIES
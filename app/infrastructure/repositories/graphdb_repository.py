@@ -1,11 +1,11 @@
 """
-GraphDB Repository Implementation using SPARQLWrapper
+GraphDB Repository Implementation over the SPARQL 1.1 protocol
 Implements repository interfaces from domain layer (Dependency Inversion Principle)
 """
-from typing import List, Optional, Dict, Any
-from SPARQLWrapper import SPARQLWrapper, JSON
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 import asyncio
-from functools import partial
+import httpx
+import orjson
 from app.domain.models import (
     Entity, EntityInfo, HealthRecord, CountryCoordinates,
     SPARQLQueryResult, EntityType, HealthMetrics, HealthMetricItem,
@@ -16,39 +16,229 @@ from app.domain.repositories import (
     IMapRepository, ISPARQLRepository
 )
 from app.infrastructure.config.settings import settings
+from app.infrastructure.repositories.query_cache import AsyncLRUCache, query_cache, query_key
+from app.infrastructure.repositories.sparql_normalize import canonicalize
+from app.infrastructure.repositories.sparql_terms import iri, lucene_prefix_query, string_literal
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Display labels for related-entity relationship types
+_RELATIONSHIP_LABELS = {"partOf": "Part of", "contains": "Contains"}
+
+# Shared prolog for every repository query, resolved once from settings
+PREFIXES = (
+    f"PREFIX wd: <{settings.wd_entity_ns}>\n"
+    f"PREFIX wdt: <{settings.wd_property_ns}>\n"
+    f"PREFIX kge: <{settings.kg_entity_ns}>\n"
+    f"PREFIX kgr: <{settings.kg_record_ns}>\n"
+    f"PREFIX kgp: <{settings.kg_property_ns}>\n"
+    "PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>\n"
+    "PREFIX schema: <http://schema.org/>\n"
+    "PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>\n"
+)
+
+# Search type restrictions, keyed by entity type
+_TYPE_FILTERS = {
+    "country": "?entity wdt:P31/wdt:P279* wd:Q6256 .",
+    "region": (
+        "?entity wdt:P31/wdt:P279* ?regionType . "
+        "FILTER(?regionType IN (wd:Q82794, wd:Q5107, wd:Q2418896))"
+    ),
+    "organization": "?entity wdt:P31/wdt:P279* wd:Q43229 .",
+}
+
+# SPARQL protocol POST with the query as the request body
+_QUERY_HEADERS = {
+    "Content-Type": "application/sparql-query",
+    "Accept": "application/sparql-results+json",
+}
+
+
+def _entity_from_binding(binding: Dict[str, Dict[str, str]], entity_type: EntityType) -> Entity:
+    """Build an Entity from a ?entity ?label [?iso3Code] binding"""
+    iso3 = binding.get("iso3Code")
+    return Entity(
+        id=binding["entity"]["value"],
+        label=binding["label"]["value"],
+        type=entity_type,
+        iso3_code=iso3["value"] if iso3 is not None else None
+    )
+
+
+class SPARQLResultStream:
+    """
+    Raw SPARQL JSON body of a streamed query, owning its pooled connection
+    The connection is released when iteration ends or on aclose(), whichever
+    comes first, so a body that is never read still frees it
+    """
+    
+    def __init__(self, response: httpx.Response):
+        self._response = response
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.aiter_bytes():
+                yield chunk
+        finally:
+            await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Return the connection to the pool; safe to call repeatedly"""
+        # Shielded so a cancelled request still releases its connection
+        await asyncio.shield(self._response.aclose())
+
 
 class GraphDBClient:
-    """SPARQL client wrapper for GraphDB"""
+    """Async SPARQL client for GraphDB"""
     
-    def __init__(self, endpoint_url: str):
+    def __init__(self, endpoint_url: str, timeout: float = 30.0, max_connections: int = 16):
         self.endpoint_url = endpoint_url
-        self.sparql = SPARQLWrapper(endpoint_url)
-        self.sparql.setReturnFormat(JSON)
+        # One pooled connection set shared by all requests; closed on app shutdown.
+        # Requests beyond max_connections wait for a free connection, so GraphDB
+        # never sees more concurrent queries than it has threads for
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
     
-    def _execute_query(self, sparql_query: str) -> Dict[str, Any]:
-        """Synchronous query execution"""
-        self.sparql.setQuery(sparql_query)
-        return self.sparql.query().convert()
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections"""
+        await self._http.aclose()
     
-    async def query(self, sparql_query: str) -> Dict[str, Any]:
-        """Execute SPARQL query asynchronously in thread pool"""
+    async def check_syntax(self, sparql_query: str, timeout: float = 2.0) -> Optional[str]:
+        """
+        Ask GraphDB to parse a query without consuming its results
+        Returns the server's error message for a malformed query, else None
+        """
         try:
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(
-                None,
-                partial(self._execute_query, sparql_query)
+            # GraphDB parses before responding; close without reading any results
+            async with self._http.stream(
+                "POST",
+                self.endpoint_url,
+                content=sparql_query.encode(),
+                headers=_QUERY_HEADERS,
+                timeout=timeout
+            ) as response:
+                if response.status_code == 400:
+                    return (await response.aread()).decode(errors="replace")
+                response.raise_for_status()
+        except httpx.ReadTimeout:
+            # Parsed and accepted, but slow to evaluate
+            pass
+        return None
+    
+    async def query(self, sparql_query: str, cache: bool = True) -> Dict[str, Any]:
+        """
+        Execute SPARQL query, serving repeats from the shared result cache
+        Cached results are shared between callers and must not be mutated;
+        pass cache=False for ad-hoc user queries
+        """
+        if not cache:
+            return await self._query_uncached(sparql_query)
+        
+        key = query_key(f"{self.endpoint_url}\n{canonicalize(sparql_query)}")
+        return await query_cache.get_or_fetch(
+            key,
+            lambda: self._query_uncached(sparql_query)
+        )
+    
+    async def stream(self, sparql_query: str) -> SPARQLResultStream:
+        """
+        Execute a query and return a stream over the raw SPARQL JSON body
+        HTTP errors are raised here, before any bytes are handed out;
+        the caller must aclose() the stream to release the connection
+        """
+        request = self._http.build_request(
+            "POST",
+            self.endpoint_url,
+            content=sparql_query.encode(),
+            headers=_QUERY_HEADERS
+        )
+        response = await self._http.send(request, stream=True)
+        if response.is_error:
+            await response.aread()
+            await response.aclose()
+            logger.error(f"SPARQL query error: {response.status_code} {response.text}")
+            logger.error(f"Query: {sparql_query}")
+            response.raise_for_status()
+        return SPARQLResultStream(response)
+    
+    def clear_cache(self) -> None:
+        """Drop all cached query results and derived entity types"""
+        query_cache.invalidate()
+        _entity_type_cache.invalidate()
+    
+    async def _query_uncached(self, sparql_query: str) -> Dict[str, Any]:
+        """Execute SPARQL query over the pooled HTTP client"""
+        try:
+            response = await self._http.post(
+                self.endpoint_url,
+                content=sparql_query.encode(),
+                headers=_QUERY_HEADERS
             )
-            return results
+            response.raise_for_status()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"SPARQL query error: {e}")
             logger.error(f"Query: {sparql_query}")
             raise
 
 
+# Entity types change rarely and the same entities recur across requests, so
+# resolved types are kept (LRU) until clear_cache; failed lookups are not cached
+_TYPE_QUERY = PREFIXES + """
+SELECT ?type WHERE {{
+    VALUES ?entity {{ {entity} }}
+    ?entity wdt:P31 ?type .
+}}
+LIMIT 1
+"""
+_entity_type_cache = AsyncLRUCache(maxsize=8192)
+
+
+async def _determine_entity_type(client: GraphDBClient, entity_id: str, kge_ns: str) -> EntityType:
+    """Determine entity type by querying GraphDB, falling back to the ID on errors"""
+    try:
+        return await _entity_type_cache.get_or_fetch(
+            entity_id.encode(),
+            lambda: _query_entity_type(client, entity_id, kge_ns)
+        )
+    except Exception as e:
+        logger.warning(f"Could not determine entity type for {entity_id}: {e}")
+        return _entity_type_from_id(entity_id, kge_ns)
+
+
+async def _query_entity_type(client: GraphDBClient, entity_id: str, kge_ns: str) -> EntityType:
+    """Entity type from its wdt:P31 class"""
+    # Derived types are cached above, so skip the raw result cache
+    results = await client.query(_TYPE_QUERY.format_map({"entity": iri(entity_id)}), cache=False)
+    if results["results"]["bindings"]:
+        type_uri = results["results"]["bindings"][0]["type"]["value"]
+        
+        # Check against known types
+        # Q6256 = country, Q82794 = geographic region, Q5107 = continent
+        # Q2418896 = economic region, Q43229 = organization
+        if "Q6256" in type_uri:  # country
+            return "country"
+        elif any(q in type_uri for q in ["Q82794", "Q5107", "Q2418896", "Q3024240"]):
+            return "region"
+        elif "Q43229" in type_uri:  # organization
+            return "organization"
+    
+    return _entity_type_from_id(entity_id, kge_ns)
+
+
+def _entity_type_from_id(entity_id: str, kge_ns: str) -> EntityType:
+    """Fallback to ID-based detection"""
+    if entity_id.startswith(kge_ns):
+        return "region"
+    return "country"  # Default for Wikidata entities
+
+
 class EntityRepository(IEntityRepository):
     """Entity repository implementation using SPARQL"""
     
@@ -57,127 +247,164 @@ class EntityRepository(IEntityRepository):
         self.kge_ns = settings.kg_entity_ns
         self.wd_ns = settings.wd_entity_ns
         self.wdt_ns = settings.wd_property_ns
-    
-    async def search(
-        self,
-        query: str,
-        entity_type: Optional[EntityType] = None,
-        limit: int = 20,
-        offset: int = 0
-    ) -> tuple[List[Entity], int]:
-        """Search entities by query string with optional type filter"""
         
-        # Build type filter
-        type_filter = ""
-        if entity_type == "country":
-            type_filter = "?entity wdt:P31/wdt:P279* wd:Q6256 ."
-        elif entity_type == "region":
-            type_filter = """
-                ?entity wdt:P31/wdt:P279* ?regionType .
-                FILTER(?regionType IN (wd:Q82794, wd:Q5107, wd:Q2418896))
-            """
-        elif entity_type == "organization":
-            type_filter = "?entity wdt:P31/wdt:P279* wd:Q43229 ."
-        
-        sparql_query = f"""
-        PREFIX wd: <{self.wd_ns}>
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX kge: <{self.kge_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT DISTINCT ?entity ?label ?iso3Code WHERE {{
+        # Query templates are built once; calls only fill in their values
+        # Only English (or untagged) labels take part in matching, so an entity
+        # is not listed once per language
+        if settings.search_use_lucene:
+            # Index probe through the GraphDB Lucene connector; {q} is a Lucene query
+            search_prefix = PREFIXES + (
+                "PREFIX luc: <http://www.ontotext.com/connectors/lucene#>\n"
+                "PREFIX inst: <http://www.ontotext.com/connectors/lucene/instance#>\n"
+            )
+            match_patterns = f"""
+            ?search a inst:{settings.search_lucene_index} ;
+                    luc:query {{q}} ;
+                    luc:entities ?entity .
+            ?entity rdfs:label ?label .
+            FILTER(LANG(?label) IN ("", "en"))
+            {{type_filter}}
+        """
+            # The Lucene query already matches the last word as a prefix
+            suggest_patterns = match_patterns
+        else:
+            search_prefix = PREFIXES
+            match_patterns = """
+            VALUES ?q {{ {q} }}
             {{
                 ?entity rdfs:label ?label .
-                FILTER(CONTAINS(LCASE(?label), LCASE("{query}")))
+                FILTER(LANG(?label) IN ("", "en"))
+                FILTER(CONTAINS(LCASE(?label), LCASE(?q)))
                 {type_filter}
-                OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
             }}
             UNION
             {{
                 ?entity rdfs:label ?label .
-                FILTER(CONTAINS(LCASE(STR(?entity)), LCASE("{query}")))
+                FILTER(LANG(?label) IN ("", "en"))
+                FILTER(CONTAINS(LCASE(STR(?entity)), LCASE(?q)))
                 {type_filter}
-                OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
             }}
-        }}
-        LIMIT {limit}
-        OFFSET {offset}
         """
+            suggest_patterns = """
+            VALUES ?q {{ {q} }}
+            ?entity rdfs:label ?label .
+            FILTER(LANG(?label) IN ("", "en"))
+            FILTER(STRSTARTS(LCASE(?label), LCASE(?q)))
+        """
+        self._lucene_search = settings.search_use_lucene
         
-        # Count query
-        count_query = f"""
-        PREFIX wd: <{self.wd_ns}>
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX kge: <{self.kge_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT (COUNT(DISTINCT ?entity) AS ?count) WHERE {{
+        # Page and total count in one round-trip; the page is OPTIONAL so the
+        # total still comes back when offset is past the last match
+        self._search_tmpl = search_prefix + """
+        SELECT ?entity ?label ?iso3Code ?count WHERE {{
             {{
-                ?entity rdfs:label ?label .
-                FILTER(CONTAINS(LCASE(?label), LCASE("{query}")))
-                {type_filter}
+                SELECT (COUNT(DISTINCT ?entity) AS ?count) WHERE {{
+                    """ + match_patterns + """
+                }}
             }}
-            UNION
-            {{
-                ?entity rdfs:label ?label .
-                FILTER(CONTAINS(LCASE(STR(?entity)), LCASE("{query}")))
-                {type_filter}
+            OPTIONAL {{
+                SELECT DISTINCT ?entity ?label ?iso3Code WHERE {{
+                    """ + match_patterns + """
+                    OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
+                }}
+                LIMIT {limit}
+                OFFSET {offset}
             }}
         }}
         """
         
+        # Autocomplete: label prefix match only, no total count
+        self._suggest_tmpl = search_prefix + """
+        SELECT ?entity ?label ?iso3Code WHERE {{
+            """ + suggest_patterns + """
+            OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
+        }}
+        LIMIT {limit}
+        """
+        
+        self._by_ids_tmpl = PREFIXES + """
+        SELECT ?entity ?label ?iso3Code WHERE {{
+            VALUES ?entity {{ {entities} }}
+            ?entity rdfs:label ?label .
+            OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
+        }}
+        """
+        
+        self._by_iso3_tmpl = PREFIXES + """
+        SELECT ?entity ?label WHERE {{
+            VALUES ?code {{ {code} }}
+            ?entity wdt:P298 ?code ;
+                    rdfs:label ?label .
+        }}
+        """
+    
+    async def search(
+        self,
+        query: str,
+        entity_type: Optional[EntityType] = None,
+        limit: int = 20,
+        offset: int = 0
+    ) -> tuple[List[Entity], int]:
+        """Search entities by query string with optional type filter"""
+        sparql_query = self._search_tmpl.format_map({
+            "q": string_literal(lucene_prefix_query(query) if self._lucene_search else query),
+            "type_filter": _TYPE_FILTERS.get(entity_type, ""),
+            "limit": limit,
+            "offset": offset,
+        })
+        
         results = await self.client.query(sparql_query)
-        count_results = await self.client.query(count_query)
+        bindings = results["results"]["bindings"]
         
-        entities = await self._parse_entities(results)
-        total = int(count_results["results"]["bindings"][0]["count"]["value"]) if count_results["results"]["bindings"] else 0
+        total = int(bindings[0]["count"]["value"]) if bindings else 0
+        page = [binding for binding in bindings if "entity" in binding]
+        entities = await self._parse_entities({"results": {"bindings": page}})
         
         return entities, total
     
     async def get_by_id(self, entity_id: str) -> Optional[Entity]:
         """Get entity by ID"""
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        return (await self.get_by_ids([entity_id])).get(entity_id)
+    
+    async def get_by_ids(self, entity_ids: List[str]) -> Dict[str, Entity]:
+        """Get several entities with one VALUES query, keyed by ID"""
+        if not entity_ids:
+            return {}
         
-        SELECT ?label ?iso3Code WHERE {{
-            <{entity_id}> rdfs:label ?label .
-            OPTIONAL {{ <{entity_id}> wdt:P298 ?iso3Code . }}
-        }}
-        """
+        sparql_query = self._by_ids_tmpl.format_map({
+            "entities": " ".join(iri(entity_id) for entity_id in entity_ids)
+        })
         
         results = await self.client.query(sparql_query)
-        bindings = results["results"]["bindings"]
-        
-        if not bindings:
-            return None
         
-        binding = bindings[0]
-        entity_type = await self._determine_entity_type(entity_id)
+        # First row per entity wins, as with LIMIT 1 lookups
+        first: Dict[str, Dict[str, Any]] = {}
+        for binding in results["results"]["bindings"]:
+            first.setdefault(binding["entity"]["value"], binding)
         
-        return Entity(
-            id=entity_id,
-            label=binding["label"]["value"],
-            type=entity_type,
-            iso3_code=binding.get("iso3Code", {}).get("value")
+        entity_types = await asyncio.gather(
+            *(self._determine_entity_type(entity_id) for entity_id in first)
         )
+        
+        return {
+            entity_id: _entity_from_binding(binding, entity_type)
+            for (entity_id, binding), entity_type in zip(first.items(), entity_types)
+        }
     
     async def get_suggestions(self, query: str, limit: int = 10) -> List[Entity]:
-        """Get autocomplete suggestions"""
-        entities, _ = await self.search(query, limit=limit)
-        return entities
+        """Get autocomplete suggestions (entities whose label starts with query)"""
+        sparql_query = self._suggest_tmpl.format_map({
+            "q": string_literal(lucene_prefix_query(query) if self._lucene_search else query),
+            "type_filter": "",
+            "limit": limit,
+        })
+        
+        results = await self.client.query(sparql_query)
+        return await self._parse_entities(results)
     
     async def get_by_iso3_code(self, iso3_code: str) -> Optional[Entity]:
         """Get entity by ISO 3166-1 alpha-3 code"""
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT ?entity ?label WHERE {{
-            ?entity wdt:P298 "{iso3_code}" ;
-                    rdfs:label ?label .
-        }}
-        """
+        sparql_query = self._by_iso3_tmpl.format_map({"code": string_literal(iso3_code)})
         
         results = await self.client.query(sparql_query)
         bindings = results["results"]["bindings"]
@@ -195,53 +422,18 @@ class EntityRepository(IEntityRepository):
     
     async def _parse_entities(self, results: Dict[str, Any]) -> List[Entity]:
         """Parse SPARQL results to Entity objects"""
-        entities = []
-        for binding in results["results"]["bindings"]:
-            entity_id = binding["entity"]["value"]
-            entity_type = await self._determine_entity_type(entity_id)
-            
-            entities.append(Entity(
-                id=entity_id,
-                label=binding["label"]["value"],
-                type=entity_type,
-                iso3_code=binding.get("iso3Code", {}).get("value")
-            ))
-        
-        return entities
+        bindings = results["results"]["bindings"]
+        entity_types = await asyncio.gather(
+            *(self._determine_entity_type(binding["entity"]["value"]) for binding in bindings)
+        )
+        return [
+            _entity_from_binding(binding, entity_type)
+            for binding, entity_type in zip(bindings, entity_types)
+        ]
     
     async def _determine_entity_type(self, entity_id: str) -> EntityType:
-        """Determine entity type by querying GraphDB"""
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX wd: <{self.wd_ns}>
-        
-        SELECT ?type WHERE {{
-            <{entity_id}> wdt:P31 ?type .
-        }}
-        LIMIT 1
-        """
-        
-        try:
-            results = await self.client.query(sparql_query)
-            if results["results"]["bindings"]:
-                type_uri = results["results"]["bindings"][0]["type"]["value"]
-                
-                # Check against known types
-                # Q6256 = country, Q82794 = geographic region, Q5107 = continent
-                # Q2418896 = economic region, Q43229 = organization
-                if "Q6256" in type_uri:  # country
-                    return "country"
-                elif any(q in type_uri for q in ["Q82794", "Q5107", "Q2418896", "Q3024240"]):
-                    return "region"
-                elif "Q43229" in type_uri:  # organization
-                    return "organization"
-        except Exception as e:
-            logger.warning(f"Could not determine entity type for {entity_id}: {e}")
-        
-        # Fallback to ID-based detection
-        if entity_id.startswith(self.kge_ns):
-            return "region"
-        return "country"  # Default for Wikidata entities
+        """Determine entity type by querying GraphDB (cached per entity)"""
+        return await _determine_entity_type(self.client, entity_id, self.kge_ns)
 
 
 class EntityInfoRepository(IEntityInfoRepository):
@@ -252,40 +444,95 @@ class EntityInfoRepository(IEntityInfoRepository):
         self.kge_ns = settings.kg_entity_ns
         self.wd_ns = settings.wd_entity_ns
         self.wdt_ns = settings.wd_property_ns
-    
-    async def get_entity_info(self, entity_id: str) -> Optional[EntityInfo]:
-        """Get complete entity information"""
-        
-        # Get basic entity info
-        basic_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX schema: <http://schema.org/>
         
+        # Query templates are built once; calls only fill in their values
+        self._basic_tmpl = PREFIXES + """
         SELECT ?label ?description ?image WHERE {{
-            <{entity_id}> rdfs:label ?label .
-            OPTIONAL {{ <{entity_id}> schema:description ?description . }}
+            VALUES ?entity {{ {entity} }}
+            ?entity rdfs:label ?label .
+            OPTIONAL {{ ?entity schema:description ?description . }}
             OPTIONAL {{ 
-                {{ <{entity_id}> wdt:P41 ?image . }}
+                {{ ?entity wdt:P41 ?image . }}
                 UNION
-                {{ <{entity_id}> wdt:P18 ?image . }}
+                {{ ?entity wdt:P18 ?image . }}
             }}
         }}
         """
         
-        results = await self.client.query(basic_query)
-        if not results["results"]["bindings"]:
-            return None
+        # Entities that the current entity is part of
+        self._part_of_tmpl = PREFIXES + """
+        SELECT DISTINCT ?related ?label ?iso3Code WHERE {{
+            VALUES ?entity {{ {entity} }}
+            ?entity wdt:P361 ?related .
+            ?related rdfs:label ?label .
+            OPTIONAL {{ ?related wdt:P298 ?iso3Code . }}
+        }}
+        LIMIT {limit}
+        """
         
-        binding = results["results"]["bindings"][0]
+        # Entities that are part of the current entity
+        self._contains_tmpl = PREFIXES + """
+        SELECT DISTINCT ?related ?label ?iso3Code WHERE {{
+            VALUES ?entity {{ {entity} }}
+            ?related wdt:P361 ?entity .
+            ?related rdfs:label ?label .
+            OPTIONAL {{ ?related wdt:P298 ?iso3Code . }}
+        }}
+        LIMIT {limit}
+        """
         
-        # Get attributes
-        attributes = await self._get_attributes(entity_id)
+        # Specific important properties with known labels
+        self._attributes_tmpl = PREFIXES + """
+        SELECT ?iso3Code ?population ?area ?capital ?capitalLabel ?inception WHERE {{
+            VALUES ?entity {{ {entity} }}
+            OPTIONAL {{ ?entity wdt:P298 ?iso3Code . }}
+            OPTIONAL {{ ?entity wdt:P1082 ?population . }}
+            OPTIONAL {{ ?entity wdt:P2046 ?area . }}
+            OPTIONAL {{
+                ?entity wdt:P36 ?capital .
+                OPTIONAL {{
+                    ?capital rdfs:label ?capitalLabel .
+                    FILTER(LANG(?capitalLabel) IN ("", "en"))
+                }}
+            }}
+            OPTIONAL {{ ?entity wdt:P571 ?inception . }}
+        }}
+        LIMIT 1
+        """
         
-        # Get related entities
-        related = await self.get_related_entities(entity_id)
+        self._by_label_tmpl = PREFIXES + """
+        SELECT ?entity WHERE {{
+            VALUES ?q {{ {label} }}
+            ?entity rdfs:label ?label .
+            FILTER(LCASE(?label) = LCASE(?q))
+        }}
+        LIMIT 1
+        """
+        
+        self._label_tmpl = PREFIXES + """
+        SELECT ?label WHERE {{
+            VALUES ?entity {{ {entity} }}
+            ?entity rdfs:label ?label .
+        }}
+        LIMIT 1
+        """
+    
+    async def get_entity_info(self, entity_id: str) -> Optional[EntityInfo]:
+        """Get complete entity information"""
+        
+        basic_query = self._basic_tmpl.format_map({"entity": iri(entity_id)})
+        
+        # Basic info, attributes, related entities and type are independent
+        results, attributes, related, entity_type = await asyncio.gather(
+            self.client.query(basic_query),
+            self._get_attributes(entity_id),
+            self._fetch_related(entity_id),
+            self._determine_entity_type(entity_id)
+        )
+        if not results["results"]["bindings"]:
+            return None
         
-        entity_type = await self._determine_entity_type(entity_id)
+        binding = results["results"]["bindings"][0]
         
         return EntityInfo(
             id=entity_id,
@@ -297,12 +544,12 @@ class EntityInfoRepository(IEntityInfoRepository):
             health_metrics=None,  # Will be populated by service layer
             related_entities=[
                 RelatedEntity(
-                    id=e.id,
-                    label=e.label,
-                    type=e.type,
+                    id=binding["related"]["value"],
+                    label=binding["label"]["value"],
+                    type=related_type,
                     relationship_type=rel_type,
-                    relationship_label="Part of" if rel_type == "partOf" else "Contains"
-                ) for e, rel_type in related
+                    relationship_label=_RELATIONSHIP_LABELS[rel_type]
+                ) for binding, rel_type, related_type in related
             ],
             sources=[
                 EntitySource(
@@ -312,80 +559,53 @@ class EntityInfoRepository(IEntityInfoRepository):
             ]
         )
     
-    async def get_related_entities(self, entity_id: str, limit: int = 10) -> List[tuple[Entity, str]]:
-        """Get related entities with relationship direction"""
-        # Get entities that current entity is part of
-        part_of_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT DISTINCT ?related ?label ?iso3Code WHERE {{
-            <{entity_id}> wdt:P361 ?related .
-            ?related rdfs:label ?label .
-            OPTIONAL {{ ?related wdt:P298 ?iso3Code . }}
-        }}
-        LIMIT {limit}
-        """
-        
-        # Get entities that are part of current entity
-        contains_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT DISTINCT ?related ?label ?iso3Code WHERE {{
-            ?related wdt:P361 <{entity_id}> .
-            ?related rdfs:label ?label .
-            OPTIONAL {{ ?related wdt:P298 ?iso3Code . }}
-        }}
-        LIMIT {limit}
-        """
-        
-        part_of_results = await self.client.query(part_of_query)
-        contains_results = await self.client.query(contains_query)
-        
-        entities = []
-        
-        # Add "part of" relationships
-        for binding in part_of_results["results"]["bindings"]:
-            entity_type = await self._determine_entity_type(binding["related"]["value"])
-            entity = Entity(
+    async def get_related_entities(self, entity_id: str, limit: int = 10) -> List[Entity]:
+        """Get entities related to given entity"""
+        return [
+            Entity(
                 id=binding["related"]["value"],
                 label=binding["label"]["value"],
-                type=entity_type,
+                type=related_type,
                 iso3_code=binding.get("iso3Code", {}).get("value")
             )
-            entities.append((entity, "partOf"))
+            for binding, _, related_type in await self._fetch_related(entity_id, limit)
+        ]
+    
+    async def _fetch_related(
+        self,
+        entity_id: str,
+        limit: int = 10
+    ) -> List[Tuple[Dict[str, Any], str, EntityType]]:
+        """
+        Fetch related entity rows as (binding, relationship type, entity type)
+        Callers build their own domain objects from the rows
+        """
+        values = {"entity": iri(entity_id), "limit": limit}
+        part_of_query = self._part_of_tmpl.format_map(values)
+        contains_query = self._contains_tmpl.format_map(values)
         
-        # Add "contains" relationships
-        for binding in contains_results["results"]["bindings"]:
-            entity_type = await self._determine_entity_type(binding["related"]["value"])
-            entity = Entity(
-                id=binding["related"]["value"],
-                label=binding["label"]["value"],
-                type=entity_type,
-                iso3_code=binding.get("iso3Code", {}).get("value")
-            )
-            entities.append((entity, "contains"))
+        part_of_results, contains_results = await asyncio.gather(
+            self.client.query(part_of_query),
+            self.client.query(contains_query)
+        )
+        
+        rows = [
+            (binding, "partOf") for binding in part_of_results["results"]["bindings"]
+        ] + [
+            (binding, "contains") for binding in contains_results["results"]["bindings"]
+        ]
+        entity_types = await asyncio.gather(
+            *(self._determine_entity_type(binding["related"]["value"]) for binding, _ in rows)
+        )
         
-        return entities
+        return [
+            (binding, rel_type, entity_type)
+            for (binding, rel_type), entity_type in zip(rows, entity_types)
+        ]
     
     async def _get_attributes(self, entity_id: str) -> List[EntityAttribute]:
         """Get entity attributes"""
-        # Get specific important properties with known labels
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX wd: <{self.wd_ns}>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT ?iso3Code ?population ?area ?capital ?inception WHERE {{
-            OPTIONAL {{ <{entity_id}> wdt:P298 ?iso3Code . }}
-            OPTIONAL {{ <{entity_id}> wdt:P1082 ?population . }}
-            OPTIONAL {{ <{entity_id}> wdt:P2046 ?area . }}
-            OPTIONAL {{ <{entity_id}> wdt:P36 ?capital . }}
-            OPTIONAL {{ <{entity_id}> wdt:P571 ?inception . }}
-        }}
-        LIMIT 1
-        """
+        sparql_query = self._attributes_tmpl.format_map({"entity": iri(entity_id)})
         
         results = await self.client.query(sparql_query)
         attributes = []
@@ -413,10 +633,13 @@ class EntityInfoRepository(IEntityInfoRepository):
                     unit="inhabitants"
                 ))
             
-            # Capital - fetch label separately if not available
+            # Capital - label comes with the query; look it up only if missing
             if "capital" in binding:
                 capital_uri = binding["capital"]["value"]
-                capital_label = await self._get_entity_label(capital_uri)
+                if "capitalLabel" in binding:
+                    capital_label = binding["capitalLabel"]["value"]
+                else:
+                    capital_label = await self._get_entity_label(capital_uri)
                 
                 attributes.append(EntityAttribute(
                     property="http://www.wikidata.org/prop/direct/P36",
@@ -452,16 +675,17 @@ class EntityInfoRepository(IEntityInfoRepository):
         
         return attributes
     
+    async def find_entity_by_label(self, label: str) -> Optional[str]:
+        """Find the URI of an entity whose label matches case-insensitively"""
+        sparql_query = self._by_label_tmpl.format_map({"label": string_literal(label)})
+        
+        results = await self.client.query(sparql_query)
+        bindings = results["results"]["bindings"]
+        return bindings[0]["entity"]["value"] if bindings else None
+    
     async def _get_entity_label(self, entity_uri: str) -> Optional[str]:
         """Get label for an entity URI"""
-        sparql_query = f"""
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        
-        SELECT ?label WHERE {{
-            <{entity_uri}> rdfs:label ?label .
-        }}
-        LIMIT 1
-        """
+        sparql_query = self._label_tmpl.format_map({"entity": iri(entity_uri)})
         
         results = await self.client.query(sparql_query)
         if results["results"]["bindings"]:
@@ -474,36 +698,5 @@ class EntityInfoRepository(IEntityInfoRepository):
         return None
     
     async def _determine_entity_type(self, entity_id: str) -> EntityType:
-        """Determine entity type by querying GraphDB"""
-        sparql_query = f"""
-        PREFIX wdt: <{self.wdt_ns}>
-        PREFIX wd: <{self.wd_ns}>
-        
-        SELECT ?type WHERE {{
-            <{entity_id}> wdt:P31 ?type .
-        }}
-        LIMIT 1
-        """
-        
-        try:
-            results = await self.client.query(sparql_query)
-            if results["results"]["bindings"]:
-                type_uri = results["results"]["bindings"][0]["type"]["value"]
-                
-                # Check against known types
-                if "Q6256" in type_uri:  # country
-                    return "country"
-                elif any(q in type_uri for q in ["Q82794", "Q5107", "Q2418896", "Q3024240"]):
-                    return "region"
-                elif "Q43229" in type_uri:  # organization
-                    return "organization"
-        except Exception as e:
-            logger.warning(f"Could not determine entity type for {entity_id}: {e}")
-        
-        # Fallback to ID-based detection
-        if entity_id.startswith(self.kge_ns):
-            return "region"
-        return "country"  # Default for Wikidata entities
-
-
-# Continue in next file due to length...
+        """Determine entity type by querying GraphDB (cached per entity)"""
+        return await _determine_entity_type(self.client, entity_id, self.kge_ns)
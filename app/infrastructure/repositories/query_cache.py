@@ -0,0 +1,111 @@
+"""
+In-process SPARQL result cache
+LRU+TTL cache used by GraphDBClient so repeated queries skip the GraphDB round-trip
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+def query_key(sparql_query: str) -> bytes:
+    """Compact cache key for a SPARQL query string"""
+    return hashlib.blake2b(sparql_query.encode(), digest_size=16).digest()
+
+
+class AsyncLRUCache:
+    """
+    LRU cache for coroutine results
+    Concurrent misses for the same key share a single fetch; entries expire
+    after ttl seconds (if set)
+    """
+    
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+        self._expires: Dict[bytes, float] = {}
+        self._pending: Dict[bytes, asyncio.Future] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._entries and not self._expire(key)
+    
+    def _expire(self, key: bytes) -> bool:
+        """Drop key if its TTL has passed; True if it was dropped"""
+        if self.ttl is not None and self._expires[key] <= time.monotonic():
+            del self._entries[key]
+            del self._expires[key]
+            return True
+        return False
+    
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """Return cached value for key, marking it recently used"""
+        if key in self._entries and not self._expire(key):
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        return default
+    
+    def set(self, key: bytes, value: Any) -> None:
+        """Store value, evicting the least recently used entry if full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if self.ttl is not None:
+            self._expires[key] = time.monotonic() + self.ttl
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._expires.pop(evicted, None)
+    
+    async def get_or_fetch(
+        self,
+        key: bytes,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return cached value or await fetch() once and cache its result"""
+        while True:
+            if key in self:
+                return self.get(key)
+            
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The leading caller was cancelled, not us: retry and take over the fetch
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await fetch()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            del self._pending[key]
+    
+    def invalidate(self, key: Optional[bytes] = None) -> None:
+        """Drop one entry, or every entry"""
+        if key is None:
+            self._entries.clear()
+            self._expires.clear()
+        else:
+            self._entries.pop(key, None)
+            self._expires.pop(key, None)
+
+
+# Shared by all GraphDB clients; keys include the endpoint URL
+query_cache = AsyncLRUCache(maxsize=1024, ttl=300)
@@ -0,0 +1,71 @@
+"""
+SPARQL query canonicalization
+Produces a normalized form of a query for use as a cache key, so queries that
+differ only cosmetically share a cache entry. The original query is still the
+one sent to GraphDB.
+"""
+import re
+
+# Strings and IRIs are matched first so their contents are never rewritten
+_TOKEN_RE = re.compile(
+    r'''
+    (?P<string>
+        """(?:[^"\\]|\\.|"(?!""))*"""
+      | \'\'\'(?:[^'\\]|\\.|'(?!''))*\'\'\'
+      | "(?:[^"\\\n]|\\.)*"
+      | '(?:[^'\\\n]|\\.)*'
+    )
+  | (?P<iri><[^<>"{}|^`\\\s]*>)
+  | (?P<comment>\#[^\n]*)
+  | (?P<ws>\s+)
+  | (?P<other>[^\s"'<\#]+|[<"'\#])
+    ''',
+    re.VERBOSE,
+)
+
+# Case-insensitive SPARQL keywords and built-in functions; variables and
+# prefixed names are excluded
+_KEYWORD_RE = re.compile(
+    r"(?<![?$:\w])("
+    r"select|construct|describe|ask|where|from|named|prefix|base|distinct|"
+    r"reduced|optional|union|minus|filter|bind|values|graph|service|silent|"
+    r"order|by|group|having|limit|offset|asc|desc|as|not|in|exists|undef|"
+    r"count|sum|min|max|avg|sample|group_concat|separator|str|lang|langmatches|"
+    r"datatype|bound|iri|uri|bnode|isiri|isuri|isblank|isliteral|isnumeric|regex|"
+    r"contains|strstarts|strends|strlen|substr|ucase|lcase|concat|replace|"
+    r"year|month|day|now|if|coalesce|sameterm|abs|round|ceil|floor"
+    r")(?![:\w])",
+    re.IGNORECASE,
+)
+
+# Leading run of PREFIX declarations (already whitespace-normalized)
+_PROLOGUE_RE = re.compile(r"^(?:prefix [^\s:]*: ?<[^>]*> ?)+")
+_PREFIX_DECL_RE = re.compile(r"prefix [^\s:]*: ?<[^>]*>")
+
+
+def canonicalize(query: str) -> str:
+    """
+    Normalize a SPARQL query for cache keying
+    Strips comments, collapses whitespace, lowercases keywords and sorts the
+    leading PREFIX declarations; strings and IRIs are left untouched
+    """
+    parts = []
+    for match in _TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind in ("ws", "comment"):
+            if parts and parts[-1] != " ":
+                parts.append(" ")
+        elif kind == "other":
+            parts.append(_KEYWORD_RE.sub(lambda m: m.group(1).lower(), match.group()))
+        else:
+            parts.append(match.group())
+    
+    normalized = "".join(parts).strip()
+    
+    prologue = _PROLOGUE_RE.match(normalized)
+    if prologue:
+        declarations = sorted(_PREFIX_DECL_RE.findall(prologue.group()))
+        body = normalized[prologue.end():]
+        normalized = " ".join(declarations + [body]) if body else " ".join(declarations)
+    
+    return normalized
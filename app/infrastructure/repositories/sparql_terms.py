@@ -0,0 +1,43 @@
+"""
+SPARQL term serialization
+Renders user-supplied values as safe IRI and string literal terms for VALUES
+bindings, so they can never break out of the query skeleton; also builds
+GraphDB Lucene connector query strings
+"""
+import re
+
+# Characters not allowed inside an IRIREF (SPARQL 1.1 grammar), plus whitespace
+_IRI_UNSAFE_RE = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+
+_STRING_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    '"': '\\"',
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+})
+
+# Lucene query syntax characters, escaped so user text is matched literally
+_LUCENE_SPECIAL_RE = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def iri(value: str) -> str:
+    """Serialize value as an IRI term, percent-encoding unsafe characters"""
+    return "<" + _IRI_UNSAFE_RE.sub(lambda m: f"%{ord(m.group()):02X}", value) + ">"
+
+
+def string_literal(value: str) -> str:
+    """Serialize value as a double-quoted string literal"""
+    return '"' + value.translate(_STRING_ESCAPES) + '"'
+
+
+def lucene_prefix_query(value: str) -> str:
+    """
+    Lucene query matching every word of value, the last one as a prefix
+    ("south east" -> "south AND east*"); wrap with string_literal before use
+    """
+    terms = [_LUCENE_SPECIAL_RE.sub(r"\\\1", term) for term in value.split()]
+    if not terms:
+        return ""
+    terms[-1] += "*"
+    return " AND ".join(terms)
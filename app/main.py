@@ -2,19 +2,23 @@
 Main FastAPI Application
 Entry point following clean architecture principles
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
 
 from app.infrastructure.config.settings import settings
+from app.presentation.dependencies import get_graphdb_client
 from app.presentation.routers import (
     search_router, entity_router, map_router, sparql_router
 )
 from app.presentation.middleware.error_handler import (
     http_exception_handler, validation_exception_handler, general_exception_handler
 )
+from app.presentation.middleware.response_cache import ResponseCacheMiddleware
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +28,13 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled GraphDB connections on shutdown"""
+    yield
+    await get_graphdb_client().aclose()
+
 # Create FastAPI application
 app = FastAPI(
     title="Knowledge Graph Health Data API",
@@ -31,7 +42,22 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Response cache for read-only endpoints; added before CORS so CORS headers
+# are applied per request rather than cached
+app.add_middleware(
+    ResponseCacheMiddleware,
+    rules=(
+        ("/api/map/countries/", 300),
+        ("/api/map/countries", 3600),  # Country coordinates are near-static
+        ("/api/sparql/samples", 300),
+        ("/api/entity/by-label", 300),
+        ("/api/search", 300),
+    )
 )
 
 # CORS Middleware
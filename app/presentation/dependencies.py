@@ -3,7 +3,6 @@ Dependency Injection Container
 Following Dependency Inversion Principle
 Provides instances of services and repositories to controllers
 """
-from functools import lru_cache
 from app.infrastructure.config.settings import settings
 from app.infrastructure.repositories.graphdb_repository import (
     GraphDBClient, EntityRepository, EntityInfoRepository
@@ -16,69 +15,78 @@ from app.application.services import (
     MapService, SPARQLQueryService
 )
 
+# Singletons, built once at import so providers are plain lookups per request
+
+# GraphDB Client
+_graphdb_client = GraphDBClient(settings.sparql_endpoint, max_connections=settings.sparql_pool_size)
+
+# Repositories
+_entity_repository = EntityRepository(_graphdb_client)
+_entity_info_repository = EntityInfoRepository(_graphdb_client)
+_health_record_repository = HealthRecordRepository(_graphdb_client)
+_map_repository = MapRepository(_graphdb_client)
+_sparql_repository = SPARQLRepository(_graphdb_client)
+
+# Services (map and SPARQL services keep their caches for the app's lifetime)
+_search_service = SearchService(_entity_repository)
+_entity_info_service = EntityInfoService(_entity_info_repository, _health_record_repository)
+_health_record_service = HealthRecordService(_health_record_repository)
+_map_service = MapService(_map_repository)
+_sparql_service = SPARQLQueryService(_sparql_repository)
+
 
-# GraphDB Client (Singleton)
-@lru_cache()
 def get_graphdb_client() -> GraphDBClient:
     """Get GraphDB client instance"""
-    return GraphDBClient(settings.sparql_endpoint)
+    return _graphdb_client
 
 
 # Repositories
-@lru_cache()
 def get_entity_repository() -> EntityRepository:
     """Get entity repository instance"""
-    return EntityRepository(get_graphdb_client())
+    return _entity_repository
 
 
-@lru_cache()
 def get_entity_info_repository() -> EntityInfoRepository:
     """Get entity info repository instance"""
-    return EntityInfoRepository(get_graphdb_client())
+    return _entity_info_repository
 
 
-@lru_cache()
 def get_health_record_repository() -> HealthRecordRepository:
     """Get health record repository instance"""
-    return HealthRecordRepository(get_graphdb_client())
+    return _health_record_repository
 
 
-@lru_cache()
 def get_map_repository() -> MapRepository:
     """Get map repository instance"""
-    return MapRepository(get_graphdb_client())
+    return _map_repository
 
 
-@lru_cache()
 def get_sparql_repository() -> SPARQLRepository:
     """Get SPARQL repository instance"""
-    return SPARQLRepository(get_graphdb_client())
+    return _sparql_repository
 
 
 # Services
 def get_search_service() -> SearchService:
     """Get search service instance"""
-    return SearchService(get_entity_repository())
+    return _search_service
 
 
 def get_entity_info_service() -> EntityInfoService:
     """Get entity info service instance"""
-    return EntityInfoService(
-        get_entity_info_repository(),
-        get_health_record_repository()
-    )
+    return _entity_info_service
 
 
 def get_health_record_service() -> HealthRecordService:
     """Get health record service instance"""
-    return HealthRecordService(get_health_record_repository())
+    return _health_record_service
 
 
 def get_map_service() -> MapService:
     """Get map service instance"""
-    return MapService(get_map_repository())
+    return _map_service
 
 
 def get_sparql_service() -> SPARQLQueryService:
     """Get SPARQL service instance"""
-    return SPARQLQueryService(get_sparql_repository())
+    return _sparql_service
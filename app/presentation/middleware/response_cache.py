@@ -0,0 +1,86 @@
+"""
+Response Caching Middleware
+Serves repeated GET requests to read-only endpoints from memory
+"""
+from typing import List, Optional, Sequence, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.repositories.query_cache import AsyncLRUCache, query_key
+
+# (status, headers, body) of a cached response
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class ResponseCacheMiddleware:
+    """
+    Pure ASGI middleware caching successful GET responses by path and query string
+    Rules are (path prefix, ttl seconds) pairs; the first matching prefix wins.
+    Cached responses carry a Cache-Control header so HTTP caches can reuse them too
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Sequence[Tuple[str, int]],
+        maxsize: int = 256,
+        stale_while_revalidate: int = 60
+    ):
+        self.app = app
+        self._rules = tuple(
+            (
+                prefix,
+                AsyncLRUCache(maxsize=maxsize, ttl=ttl),
+                f"public, max-age={ttl}, stale-while-revalidate={stale_while_revalidate}".encode()
+            )
+            for prefix, ttl in rules
+        )
+    
+    def _match(self, path: str) -> Optional[Tuple[AsyncLRUCache, bytes]]:
+        for prefix, cache, cache_control in self._rules:
+            if path.startswith(prefix):
+                return cache, cache_control
+        return None
+    
+    def clear(self) -> None:
+        """Drop every cached response"""
+        for _, cache, _ in self._rules:
+            cache.invalidate()
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        
+        rule = self._match(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+        
+        cache, cache_control = rule
+        key = query_key(f"{scope['path']}?{scope['query_string'].decode('latin-1')}")
+        cached: Optional[CachedResponse] = cache.get(key)
+        if cached is not None:
+            status, cached_headers, body = cached
+            await send({"type": "http.response.start", "status": status, "headers": cached_headers})
+            await send({"type": "http.response.body", "body": body})
+            return
+        
+        # Relay the response while keeping a copy of successful ones
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        cacheable = False
+        
+        async def send_and_capture(message: Message) -> None:
+            nonlocal cacheable
+            if message["type"] == "http.response.start":
+                cacheable = message["status"] == 200
+                if cacheable:
+                    headers.extend(message.get("headers", ()))
+                    headers.append((b"cache-control", cache_control))
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body" and cacheable:
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    cache.set(key, (200, headers, b"".join(chunks)))
+            await send(message)
+        
+        await self.app(scope, receive, send_and_capture)
@@ -2,7 +2,9 @@
 Entity Router
 Handles /api/entities and /api/entity endpoints
 """
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.application.services import EntityInfoService, SearchService, HealthRecordService
 from app.application.dto import (
@@ -64,22 +66,21 @@ async def get_entity_by_id(
     Get detailed information about a specific entity
     GET /api/entities/{id}
     """
-    # Get basic entity
-    entity = await search_service.get_entity_by_id(entity_id)
+    # Health records and related entities only need the ID, so fetch all three at once
+    entity, health_records, related_entities = await asyncio.gather(
+        search_service.get_entity_by_id(entity_id),
+        health_record_service.get_health_records(entity_id),
+        entity_info_service.get_related_entities(entity_id, limit=5)
+    )
     if not entity:
         raise HTTPException(status_code=404, detail="Entity not found")
     
-    # Get health records
-    health_records = await health_record_service.get_health_records(entity_id)
-    
-    # Get related entities
-    related_entities = await entity_info_service.get_related_entities(entity_id, limit=5)
-    
-    return EntityDetailResponseDTO(
-        entity=EntityMapper.to_dto(entity),
-        healthRecords=HealthRecordMapper.to_dto_list(health_records),
-        relatedEntities=EntityMapper.to_dto_list(related_entities) if related_entities else None
-    )
+    # Server-built data: serialize plain dicts, skipping Pydantic entirely
+    return ORJSONResponse({
+        "entity": EntityMapper.to_dict(entity),
+        "healthRecords": HealthRecordMapper.to_dict_list(health_records),
+        "relatedEntities": EntityMapper.to_dict_list(related_entities) if related_entities else None
+    })
 
 
 @router.get("/entity/{entity_id:path}", response_model=InfoBoxResponseDTO)
@@ -3,6 +3,7 @@ Search Router
 Handles /api/search endpoints
 """
 from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 from app.application.services import SearchService
 from app.application.dto import SearchResponseDTO, EntityDTO, EntityDetailResponseDTO
@@ -32,12 +33,13 @@ async def search_entities(
         page_size=pageSize
     )
     
-    return SearchResponseDTO(
-        results=EntityMapper.to_dto_list(entities),
-        total=total,
-        page=current_page,
-        pageSize=pageSize
-    )
+    # Server-built data: serialize plain dicts, skipping Pydantic entirely
+    return ORJSONResponse({
+        "results": EntityMapper.to_dict_list(entities),
+        "total": total,
+        "page": current_page,
+        "pageSize": pageSize
+    })
 
 
 @router.get("/suggestions", response_model=list[EntityDTO])
@@ -50,4 +52,4 @@ async def get_suggestions(
     GET /api/search/suggestions?query={query}
     """
     entities = await search_service.get_suggestions(query)
-    return EntityMapper.to_dto_list(entities)
+    return ORJSONResponse(EntityMapper.to_dict_list(entities))
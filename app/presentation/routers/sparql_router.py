@@ -3,6 +3,8 @@ SPARQL Router
 Handles /api/sparql endpoints
 """
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from app.application.services import SPARQLQueryService
 from app.application.dto import (
     SPARQLQueryRequest, SPARQLQueryResponseDTO,
@@ -24,17 +26,22 @@ async def execute_sparql_query(
     Body: { "query": "SELECT...", "format": "json", "limit": 100 }
     """
     try:
-        result = await sparql_service.execute_query(
+        body = await sparql_service.stream_query(
             query=request.query,
             limit=request.limit
         )
-        
-        return SPARQLQueryResponseDTO(
-            head={"vars": result.variables},
-            results={"bindings": result.bindings}
-        )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Query execution error: {str(e)}")
+    
+    # GraphDB already answers in SPARQL JSON, so relay its bytes without parsing.
+    # Headers are sent before the body is read, so a GraphDB failure mid-body
+    # truncates the 200 response; the background task releases the connection
+    # even when the client disconnects before the first chunk
+    return StreamingResponse(
+        body,
+        media_type="application/sparql-results+json",
+        background=BackgroundTask(body.aclose)
+    )
 
 
 @router.post("/validate", response_model=SPARQLValidationResponseDTO)
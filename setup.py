@@ -2,10 +2,49 @@
 Setup script for development environment
 Run this to set up the backend for development
 """
+import argparse
 import os
+import platform
+import shutil
 import sys
 from pathlib import Path
 
+_MIN_PYTHON = (3, 11)
+
+# Seconds before a hung pip or pytest run is killed
+_INSTALL_TIMEOUT = 600
+_TEST_TIMEOUT = 600
+
+_RULE = "=" * 60
+
+_BANNER = f"""{_RULE}
+Knowledge Graph Backend - Development Setup
+{_RULE}
+"""
+
+_NEXT_STEPS = f"""
+{_RULE}
+Setup Complete!
+{_RULE}
+
+Next steps:
+1. Edit .env file with your GraphDB settings
+2. Start GraphDB: docker-compose up -d graphdb
+3. Load RDF data into GraphDB repository 'knowledge-graph'
+4. Run the development server:
+   uvicorn app.main:app --reload --port 3000
+
+API Documentation will be available at:
+   http://localhost:3000/api/docs
+
+To run tests:
+   pytest
+
+To run with coverage:
+   pytest --cov=app
+{_RULE}
+"""
+
 
 def create_env_file():
     """Create .env file from .env.example if it doesn't exist"""
@@ -14,7 +53,7 @@ def create_env_file():
     
     if not env_file.exists() and env_example.exists():
         print("Creating .env file from .env.example...")
-        env_file.write_text(env_example.read_text())
+        shutil.copyfile(env_example, env_file)
         print("✓ .env file created. Please edit it with your settings.")
     elif env_file.exists():
         print("✓ .env file already exists")
@@ -24,25 +63,43 @@ def create_env_file():
 
 def check_python_version():
     """Check if Python version is 3.11+"""
-    if sys.version_info < (3, 11):
-        print(f"⚠ Warning: Python 3.11+ recommended, you have {sys.version}")
+    if sys.version_info[:2] < _MIN_PYTHON:
+        print(f"⚠ Warning: Python 3.11+ recommended, you have {platform.python_version()}")
         return False
-    print(f"✓ Python version: {sys.version}")
+    print(f"✓ Python version: {platform.python_version()}")
     return True
 
 
-def install_dependencies():
-    """Install dependencies from requirements.txt"""
+def install_dependencies(packages=None):
+    """
+    Install dependencies from requirements.txt, or the given packages,
+    with a single pip invocation
+    """
     import subprocess
     
+    targets = list(packages) if packages else ["-r", "requirements.txt"]
+    env = {**os.environ, "PIP_CACHE_DIR": str(Path.home() / ".cache" / "peladen-pip")}
+    
     print("\nInstalling dependencies...")
     try:
-        subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
+        subprocess.run(
+            [
+                sys.executable, "-m", "pip", "install",
+                "--prefer-binary", "--disable-pip-version-check", "--no-input",
+                *targets
+            ],
+            check=True,
+            env=env,
+            timeout=_INSTALL_TIMEOUT
+        )
         print("✓ Dependencies installed")
         return True
     except subprocess.CalledProcessError:
         print("✗ Failed to install dependencies")
         return False
+    except subprocess.TimeoutExpired:
+        print(f"✗ Dependency installation timed out after {_INSTALL_TIMEOUT}s")
+        return False
 
 
 def run_tests():
@@ -51,13 +108,22 @@ def run_tests():
     
     print("\nRunning tests...")
     try:
-        result = subprocess.run([sys.executable, "-m", "pytest", "tests/", "-v"], check=False)
+        # No path argument so pytest collects only the configured testpaths;
+        # one worker per core, tests sharing an xdist_group stay on one worker
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-n", "auto", "--dist", "loadgroup", "-v"],
+            check=False,
+            timeout=_TEST_TIMEOUT
+        )
         if result.returncode == 0:
             print("✓ All tests passed")
             return True
         else:
             print("⚠ Some tests failed (this is expected if GraphDB is not running)")
             return False
+    except subprocess.TimeoutExpired:
+        print(f"⚠ Tests timed out after {_TEST_TIMEOUT}s")
+        return False
     except Exception as e:
         print(f"⚠ Could not run tests: {e}")
         return False
@@ -65,29 +131,37 @@ def run_tests():
 
 def print_next_steps():
     """Print next steps for the user"""
-    print("\n" + "="*60)
-    print("Setup Complete!")
-    print("="*60)
-    print("\nNext steps:")
-    print("1. Edit .env file with your GraphDB settings")
-    print("2. Start GraphDB: docker-compose up -d graphdb")
-    print("3. Load RDF data into GraphDB repository 'knowledge-graph'")
-    print("4. Run the development server:")
-    print("   uvicorn app.main:app --reload --port 3000")
-    print("\nAPI Documentation will be available at:")
-    print("   http://localhost:3000/api/docs")
-    print("\nTo run tests:")
-    print("   pytest")
-    print("\nTo run with coverage:")
-    print("   pytest --cov=app")
-    print("="*60)
-
-
-def main():
+    sys.stdout.write(_NEXT_STEPS)
+    sys.stdout.flush()
+
+
+def parse_args(argv=None):
+    """Parse command-line flags; unset flags fall back to prompting"""
+    parser = argparse.ArgumentParser(description="Set up the backend for development")
+    parser.add_argument(
+        "--install", action=argparse.BooleanOptionalAction, default=None,
+        help="install dependencies from requirements.txt"
+    )
+    parser.add_argument(
+        "--test", action=argparse.BooleanOptionalAction, default=None,
+        help="run the test suite after setup"
+    )
+    return parser.parse_args(argv)
+
+
+def confirm(flag, prompt):
+    """Use the flag if given, otherwise ask (only on an interactive terminal)"""
+    if flag is not None:
+        return flag
+    if not sys.stdin.isatty():
+        return False
+    return input(prompt).lower().strip() == 'y'
+
+
+def main(argv=None):
     """Main setup function"""
-    print("="*60)
-    print("Knowledge Graph Backend - Development Setup")
-    print("="*60)
+    args = parse_args(argv)
+    sys.stdout.write(_BANNER)
     
     # Change to script directory
     os.chdir(Path(__file__).parent)
@@ -96,15 +170,13 @@ def main():
     check_python_version()
     create_env_file()
     
-    # Ask user if they want to install dependencies
-    response = input("\nInstall dependencies now? (y/n): ").lower().strip()
-    if response == 'y':
+    # Install dependencies, then optionally run tests
+    if confirm(args.install, "\nInstall dependencies now? (y/n): "):
         install_dependencies()
-        
-        # Ask if they want to run tests
-        response = input("\nRun tests? (y/n): ").lower().strip()
-        if response == 'y':
+        if confirm(args.test, "\nRun tests? (y/n): "):
             run_tests()
+    elif args.test:
+        run_tests()
     
     print_next_steps()
 
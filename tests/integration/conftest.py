@@ -0,0 +1,51 @@
+"""
+Shared fixtures for API integration tests
+"""
+import socket
+from urllib.parse import urlsplit
+import httpx
+import pytest
+import pytest_asyncio
+
+
+def _graphdb_reachable(url: str, timeout: float = 0.2) -> bool:
+    """Whether a TCP connection to the GraphDB server can be opened"""
+    parts = urlsplit(url)
+    try:
+        with socket.create_connection((parts.hostname, parts.port or 80), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked graphdb after a single probe when GraphDB is down"""
+    graphdb_items = [item for item in items if item.get_closest_marker("graphdb")]
+    if not graphdb_items:
+        return
+    
+    from app.infrastructure.config.settings import settings
+    if _graphdb_reachable(settings.graphdb_url):
+        return
+    
+    skip = pytest.mark.skip(reason=f"GraphDB unavailable at {settings.graphdb_url}")
+    for item in graphdb_items:
+        item.add_marker(skip)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """
+    One in-process ASGI client per session (per worker under xdist)
+    Requests call the app directly, without TestClient's thread portal;
+    the app lifespan runs once around the session. The app is imported here
+    so collection and filtered runs don't pay for loading the whole stack
+    """
+    from app.main import app
+    
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test"
+        ) as async_client:
+            yield async_client
@@ -3,26 +3,32 @@ Integration tests for API endpoints
 Testing the complete stack
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+import pytest_asyncio
 
-client = TestClient(app)
+# Share the session event loop with the session-scoped client
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def countries_response(client):
+    """Country coordinates fetched once and shared by the map tests"""
+    return await client.get("/api/map/countries")
 
 
 class TestHealthEndpoints:
     """Test health check endpoints"""
     
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client):
         """Should return API information"""
-        response = client.get("/")
+        response = await client.get("/")
         assert response.status_code == 200
         data = response.json()
         assert data["name"] == "Knowledge Graph Health Data API"
         assert data["status"] == "running"
     
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Should return healthy status"""
-        response = client.get("/health")
+        response = await client.get("/health")
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
 
@@ -30,40 +36,51 @@ class TestHealthEndpoints:
 class TestSearchEndpoints:
     """Test search endpoints"""
     
-    def test_search_requires_query(self):
+    async def test_search_requires_query(self, client):
         """Should return 422 if query is missing"""
-        response = client.get("/api/search")
+        response = await client.get("/api/search")
         assert response.status_code == 422
     
-    def test_search_validates_page_number(self):
+    async def test_search_validates_page_number(self, client):
         """Should validate page number >= 1"""
-        response = client.get("/api/search?query=test&page=0")
+        response = await client.get("/api/search?query=test&page=0")
         assert response.status_code == 422
+    
+    @pytest.mark.graphdb
+    async def test_search_returns_paginated_results(self, client):
+        """Should query GraphDB and return a page of results"""
+        response = await client.get("/api/search?query=indonesia&pageSize=5")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["page"] == 1
+        assert data["pageSize"] == 5
+        assert len(data["results"]) <= 5
 
 
+@pytest.mark.xdist_group("sparql")
 class TestSPARQLEndpoints:
     """Test SPARQL endpoints"""
     
-    def test_get_sample_queries(self):
+    async def test_get_sample_queries(self, client):
         """Should return sample queries"""
-        response = client.get("/api/sparql/samples")
+        response = await client.get("/api/sparql/samples")
         assert response.status_code == 200
         data = response.json()
         assert "queries" in data
         assert isinstance(data["queries"], list)
     
-    def test_validate_query_requires_query(self):
+    async def test_validate_query_requires_query(self, client):
         """Should return error if query is missing"""
-        response = client.post("/api/sparql/validate", json={})
+        response = await client.post("/api/sparql/validate", json={})
         assert response.status_code == 400
 
 
 class TestMapEndpoints:
     """Test map endpoints"""
     
-    def test_get_country_coordinates(self):
+    async def test_get_country_coordinates(self, countries_response):
         """Should return list of country coordinates"""
-        response = client.get("/api/map/countries")
+        response = countries_response
         assert response.status_code == 200
         data = response.json()
         assert isinstance(data, list)
@@ -0,0 +1,183 @@
+"""
+Unit tests for mappers
+Testing domain model to DTO conversion
+"""
+from app.application.mappers import (
+    EntityMapper, HealthRecordMapper, HealthMetricsMapper,
+    EntityInfoMapper, CountryCoordinatesMapper
+)
+from app.application.dto import (
+    EntityDTO, HealthRecordDTO, HealthMetricsDTO, EntityInfoDTO,
+    CountryCoordinatesDTO
+)
+from app.domain.models import (
+    Entity, HealthRecord, HealthMetrics, HealthMetricItem, HealthMetricsArray, EntityInfo,
+    EntityAttribute, RelatedEntity, EntitySource, CountryCoordinates
+)
+
+
+def _assert_matches_validated(dto):
+    """Constructed DTO must match the validated DTO field for field"""
+    validated = type(dto).model_validate(dto.model_dump())
+    assert dto.model_fields_set == set(type(dto).model_fields)
+    assert dto.model_dump() == validated.model_dump()
+
+
+class TestEntityMapper:
+    """Test EntityMapper"""
+    
+    def test_to_dto_sets_all_fields(self):
+        """Should populate every EntityDTO field"""
+        entity = Entity(
+            id="http://www.wikidata.org/entity/Q252",
+            label="Indonesia",
+            type="country",
+            iso3_code="IDN"
+        )
+        
+        dto = EntityMapper.to_dto(entity)
+        
+        assert isinstance(dto, EntityDTO)
+        assert dto.iso3Code == "IDN"
+        _assert_matches_validated(dto)
+    
+    def test_to_dict_list_matches_dto_json(self):
+        """Plain dicts should serialize exactly like the DTOs"""
+        entities = [
+            Entity(id="http://www.wikidata.org/entity/Q252", label="Indonesia", type="country", iso3_code="IDN"),
+            Entity(id="http://kg.gaung.org/entity/asean", label="ASEAN", type="region")
+        ]
+        
+        dicts = EntityMapper.to_dict_list(entities)
+        
+        assert dicts == [
+            dto.model_dump(mode="json", by_alias=True) for dto in EntityMapper.to_dto_list(entities)
+        ]
+        assert EntityMapper.to_dict(entities[0]) == dicts[0]
+
+
+class TestHealthRecordMapper:
+    """Test HealthRecordMapper"""
+    
+    def test_to_dto_sets_all_fields(self):
+        """Should populate every HealthRecordDTO field"""
+        record = HealthRecord(
+            id="record1",
+            location="http://www.wikidata.org/entity/Q252",
+            year=2020,
+            hiv_cases=1000.0,
+            bcg=95.0,
+            population_age0=4500000.0
+        )
+        
+        dto = HealthRecordMapper.to_dto(record)
+        
+        assert isinstance(dto, HealthRecordDTO)
+        assert dto.hivCases == 1000.0
+        assert dto.populationAge0 == 4500000.0
+        assert dto.malariaCases is None
+        _assert_matches_validated(dto)
+    
+    def test_to_dto_list_matches_to_dto(self):
+        """Should map each record the same way as to_dto"""
+        records = [
+            HealthRecord(id="r1", location="loc", year=2020, hiv_cases=1.0),
+            HealthRecord(id="r2", location="loc", year=2019, dtp3=80.0)
+        ]
+        
+        dtos = HealthRecordMapper.to_dto_list(records)
+        
+        assert [d.model_dump() for d in dtos] == [
+            HealthRecordMapper.to_dto(r).model_dump() for r in records
+        ]
+    
+    def test_to_dict_list_matches_dto_json(self):
+        """Plain dicts should serialize exactly like the DTOs"""
+        records = [
+            HealthRecord(id="r1", location="loc", year=2020, hiv_cases=1.0),
+            HealthRecord(id="r2", location="loc", year=2019, dtp3=80.0)
+        ]
+        
+        dicts = HealthRecordMapper.to_dict_list(records)
+        
+        assert dicts == [
+            dto.model_dump(mode="json", by_alias=True) for dto in HealthRecordMapper.to_dto_list(records)
+        ]
+
+
+class TestHealthMetricsMapper:
+    """Test HealthMetricsMapper"""
+    
+    def test_to_dto_returns_none_for_missing_metrics(self):
+        """Should return None when there are no metrics"""
+        assert HealthMetricsMapper.to_dto(None) is None
+    
+    def test_to_dto_sets_all_fields(self):
+        """Should map every metric group"""
+        metrics = HealthMetrics(
+            disease_cases=HealthMetricsArray.from_items([HealthMetricItem(
+                id="hivCases", label="HIV/AIDS Cases", value=1000.0,
+                year=2020, unit="cases", category="disease"
+            )]),
+            vaccination_coverage=HealthMetricsArray.from_items([HealthMetricItem(
+                id="bcg", label="BCG", value=95.0,
+                year=2020, unit="children", category="vaccination"
+            )]),
+            available_years=[2020]
+        )
+        
+        dto = HealthMetricsMapper.to_dto(metrics)
+        
+        assert isinstance(dto, HealthMetricsDTO)
+        assert dto.diseaseCases[0].id == "hivCases"
+        assert dto.vaccinationCoverage[0].category == "vaccination"
+        _assert_matches_validated(dto)
+
+
+class TestEntityInfoMapper:
+    """Test EntityInfoMapper"""
+    
+    def test_to_dto_sets_all_fields(self):
+        """Should populate every EntityInfoDTO field"""
+        entity_info = EntityInfo(
+            id="http://www.wikidata.org/entity/Q252",
+            label="Indonesia",
+            type="country",
+            attributes=[EntityAttribute(
+                property="http://www.wikidata.org/prop/direct/P298",
+                property_label="ISO 3166-1 alpha-3 code",
+                value="IDN"
+            )],
+            related_entities=[RelatedEntity(
+                id="http://www.wikidata.org/entity/Q7261",
+                label="Southeast Asia",
+                type="region",
+                relationship_type="partOf",
+                relationship_label="Part of"
+            )],
+            sources=[EntitySource(name="Wikidata")]
+        )
+        
+        dto = EntityInfoMapper.to_dto(entity_info)
+        
+        assert isinstance(dto, EntityInfoDTO)
+        assert dto.attributes[0].propertyLabel == "ISO 3166-1 alpha-3 code"
+        assert dto.relatedEntities[0].relationshipType == "partOf"
+        _assert_matches_validated(dto)
+
+
+class TestCountryCoordinatesMapper:
+    """Test CountryCoordinatesMapper"""
+    
+    def test_to_dto_list(self):
+        """Should convert every coordinate"""
+        coords = [
+            CountryCoordinates(iso3_code="IDN", label="Indonesia", latitude=-0.7893, longitude=113.9213),
+            CountryCoordinates(iso3_code="IND", label="India", latitude=20.5937, longitude=78.9629)
+        ]
+        
+        dtos = CountryCoordinatesMapper.to_dto_list(coords)
+        
+        assert [d.iso3Code for d in dtos] == ["IDN", "IND"]
+        assert all(isinstance(d, CountryCoordinatesDTO) for d in dtos)
+        _assert_matches_validated(dtos[0])
@@ -3,71 +3,82 @@ Unit tests for domain models
 Testing business logic and validation
 """
 import pytest
+from dataclasses import FrozenInstanceError
 from app.domain.models import (
-    Entity, HealthRecord, CountryCoordinates, EntityInfo
+    Entity, HealthRecord, CountryCoordinates, EntityInfo, EntityAttribute,
+    HealthMetricItem, HealthMetricsArray
 )
 
 
+# Valid constructor arguments; tests override single fields
+_ENTITY_KW = {
+    "id": "http://www.wikidata.org/entity/Q252",
+    "label": "Indonesia",
+    "type": "country",
+    "iso3_code": "IDN"
+}
+_HEALTH_RECORD_KW = {
+    "id": "record1",
+    "location": "http://www.wikidata.org/entity/Q252",
+    "year": 2020
+}
+_COORDINATES_KW = {
+    "iso3_code": "IDN",
+    "label": "Indonesia",
+    "latitude": -0.7893,
+    "longitude": 113.9213
+}
+
+
 class TestEntity:
     """Test Entity model"""
     
     def test_create_valid_entity(self):
         """Should create entity with valid data"""
-        entity = Entity(
-            id="http://www.wikidata.org/entity/Q252",
-            label="Indonesia",
-            type="country",
-            iso3_code="IDN"
-        )
+        entity = Entity(**_ENTITY_KW)
         assert entity.id == "http://www.wikidata.org/entity/Q252"
         assert entity.label == "Indonesia"
         assert entity.type == "country"
         assert entity.iso3_code == "IDN"
     
-    def test_entity_requires_id(self):
-        """Should raise error if ID is empty"""
-        with pytest.raises(ValueError, match="Entity ID cannot be empty"):
-            Entity(id="", label="Test", type="country")
+    def test_constructor_skips_validation(self):
+        """Raw constructor is for trusted data and does not validate"""
+        entity = Entity(**{**_ENTITY_KW, "id": "", "label": ""})
+        assert entity.id == ""
     
-    def test_entity_requires_label(self):
-        """Should raise error if label is empty"""
-        with pytest.raises(ValueError, match="Entity label cannot be empty"):
-            Entity(id="test", label="", type="country")
+    @pytest.mark.parametrize("override,match", [
+        ({"id": ""}, "Entity ID cannot be empty"),
+        ({"label": ""}, "Entity label cannot be empty"),
+    ])
+    def test_entity_validation(self, override, match):
+        """Should raise error if ID or label is empty"""
+        with pytest.raises(ValueError, match=match):
+            Entity.validated(**{**_ENTITY_KW, **override})
 
 
 class TestHealthRecord:
     """Test HealthRecord model"""
     
-    def test_create_valid_health_record(self):
+    @pytest.fixture(scope="class")
+    def health_record(self):
+        """Valid record with only some health fields set, shared by the class"""
+        return HealthRecord(**_HEALTH_RECORD_KW, hiv_cases=1000.0, tuberculosis_cases=5000.0)
+    
+    def test_create_valid_health_record(self, health_record):
         """Should create health record with valid data"""
-        record = HealthRecord(
-            id="record1",
-            location="http://www.wikidata.org/entity/Q252",
-            year=2020,
-            hiv_cases=1000.0,
-            tuberculosis_cases=5000.0
-        )
-        assert record.year == 2020
-        assert record.hiv_cases == 1000.0
+        assert health_record.year == 2020
+        assert health_record.hiv_cases == 1000.0
     
-    def test_invalid_year_raises_error(self):
-        """Should raise error for invalid year"""
+    @pytest.mark.parametrize("year", [1800, 2200])
+    def test_invalid_year_raises_error(self, year):
+        """Should raise error for years outside 1900-2100"""
         with pytest.raises(ValueError, match="Invalid year"):
-            HealthRecord(
-                id="record1",
-                location="test",
-                year=1800
-            )
+            HealthRecord.validated(**{**_HEALTH_RECORD_KW, "year": year})
     
-    def test_optional_fields_can_be_none(self):
-        """Optional health fields can be None"""
-        record = HealthRecord(
-            id="record1",
-            location="test",
-            year=2020
-        )
-        assert record.hiv_cases is None
-        assert record.malaria_cases is None
+    def test_optional_fields_can_be_none(self, health_record):
+        """Optional health fields left unset default to None"""
+        assert health_record.malaria_cases is None
+        assert health_record.bcg is None
 
 
 class TestCountryCoordinates:
@@ -75,31 +86,72 @@ class TestCountryCoordinates:
     
     def test_valid_coordinates(self):
         """Should create coordinates with valid data"""
-        coords = CountryCoordinates(
-            iso3_code="IDN",
-            label="Indonesia",
-            latitude=-0.7893,
-            longitude=113.9213
-        )
+        coords = CountryCoordinates(**_COORDINATES_KW)
         assert coords.latitude == -0.7893
         assert coords.longitude == 113.9213
     
-    def test_invalid_latitude_raises_error(self):
-        """Should raise error for invalid latitude"""
-        with pytest.raises(ValueError, match="Invalid latitude"):
-            CountryCoordinates(
-                iso3_code="IDN",
-                label="Indonesia",
-                latitude=91.0,  # Invalid
-                longitude=0.0
-            )
+    @pytest.mark.parametrize("override,match", [
+        ({"latitude": 91.0}, "Invalid latitude"),
+        ({"longitude": 181.0}, "Invalid longitude"),
+    ])
+    def test_coordinates_validation(self, override, match):
+        """Should raise error for out-of-range latitude or longitude"""
+        with pytest.raises(ValueError, match=match):
+            CountryCoordinates.validated(**{**_COORDINATES_KW, **override})
+
+
+class TestEntityAttribute:
+    """Test EntityAttribute model"""
+    
+    def test_is_immutable_and_hashable(self):
+        """Frozen attributes can be shared and used as cache keys"""
+        attribute = EntityAttribute(property="P36", property_label="capital", value="Jakarta")
+        
+        with pytest.raises(FrozenInstanceError):
+            attribute.value = "Bandung"
+        assert hash(attribute) == hash(
+            EntityAttribute(property="P36", property_label="capital", value="Jakarta")
+        )
+
+
+class TestHealthMetricsArray:
+    """Test HealthMetricsArray model"""
+    
+    @pytest.fixture
+    def items(self):
+        """Metric items for two metrics across two years"""
+        return [
+            HealthMetricItem("bcg", "BCG", 90.0, 2020, "children", "vaccination"),
+            HealthMetricItem("bcg", "BCG", 80.0, 2020, "children", "vaccination"),
+            HealthMetricItem("hivCases", "HIV/AIDS Cases", 5.0, 2020, "cases", "disease"),
+            HealthMetricItem("bcg", "BCG", 70.0, 2019, "children", "vaccination"),
+        ]
+    
+    def test_round_trips_items(self, items):
+        """to_items should rebuild the original items in order"""
+        soa = HealthMetricsArray.from_items(items)
+        
+        assert len(soa) == 4
+        assert soa.metric_ids == ["bcg", "hivCases"]
+        assert soa.to_items() == items
+    
+    def test_appends_values_for_known_metrics(self):
+        """for_metrics should fix metric codes up front and append should add values"""
+        soa = HealthMetricsArray.for_metrics([
+            ("bcg", "BCG", "children", "vaccination"),
+            ("dtp3", "DTP3", "children", "vaccination"),
+        ])
+        
+        soa.append(1, 2020, 85.0)
+        
+        assert soa.to_items() == [HealthMetricItem("dtp3", "DTP3", 85.0, 2020, "children", "vaccination")]
+        assert soa.value_range("bcg") is None
     
-    def test_invalid_longitude_raises_error(self):
-        """Should raise error for invalid longitude"""
-        with pytest.raises(ValueError, match="Invalid longitude"):
-            CountryCoordinates(
-                iso3_code="IDN",
-                label="Indonesia",
-                latitude=0.0,
-                longitude=181.0  # Invalid
-            )
+    def test_aggregates_one_metric(self, items):
+        """Should group by year and compute ranges for a single metric"""
+        soa = HealthMetricsArray.from_items(items)
+        
+        assert soa.mean_by_year("bcg") == {2020: 85.0, 2019: 70.0}
+        assert soa.value_range("bcg") == (70.0, 90.0)
+        assert soa.mean_by_year("polio3") == {}
+        assert soa.value_range("polio3") is None
@@ -0,0 +1,99 @@
+"""
+Unit tests for the SPARQL query cache
+"""
+import asyncio
+import pytest
+from app.infrastructure.repositories import query_cache as query_cache_module
+from app.infrastructure.repositories.query_cache import AsyncLRUCache, query_key
+
+
+class TestAsyncLRUCache:
+    """Test AsyncLRUCache"""
+    
+    def test_evicts_least_recently_used(self):
+        """Should evict the oldest unused entry once full"""
+        cache = AsyncLRUCache(maxsize=2)
+        cache.set(b"a", 1)
+        cache.set(b"b", 2)
+        cache.get(b"a")
+        cache.set(b"c", 3)
+        
+        assert b"a" in cache
+        assert b"b" not in cache
+        assert b"c" in cache
+    
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        """Entries disappear once their TTL has passed"""
+        now = 1000.0
+        monkeypatch.setattr(query_cache_module.time, "monotonic", lambda: now)
+        cache = AsyncLRUCache(ttl=300)
+        cache.set(b"a", 1)
+        
+        now += 299
+        assert cache.get(b"a") == 1
+        
+        now += 1
+        assert b"a" not in cache
+        assert cache.get(b"a") is None
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Should run fetch once for concurrent requests of one key"""
+        cache = AsyncLRUCache()
+        calls = 0
+        
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            return {"results": {"bindings": []}}
+        
+        key = query_key("SELECT * WHERE { ?s ?p ?o }")
+        results = await asyncio.gather(*(cache.get_or_fetch(key, fetch) for _ in range(5)))
+        
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_cached(self):
+        """Errors propagate and the next call fetches again"""
+        cache = AsyncLRUCache()
+        
+        async def fail():
+            raise RuntimeError("GraphDB unavailable")
+        
+        async def succeed():
+            return 42
+        
+        with pytest.raises(RuntimeError):
+            await cache.get_or_fetch(b"k", fail)
+        
+        assert await cache.get_or_fetch(b"k", succeed) == 42
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """A follower should fetch itself when the caller it waited on is cancelled"""
+        cache = AsyncLRUCache()
+        started = asyncio.Event()
+        calls = 0
+        
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.sleep(3600)
+            return 42
+        
+        leader = asyncio.create_task(cache.get_or_fetch(b"k", fetch))
+        await started.wait()
+        follower = asyncio.create_task(cache.get_or_fetch(b"k", fetch))
+        await asyncio.sleep(0)
+        
+        leader.cancel()
+        
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await follower == 42
+        assert calls == 2
+        assert cache.get(b"k") == 42
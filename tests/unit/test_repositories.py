@@ -0,0 +1,620 @@
+"""
+Unit tests for GraphDB repositories
+Testing SPARQL result parsing with a stubbed client
+"""
+import asyncio
+import dataclasses
+import httpx
+import pytest
+from unittest.mock import Mock, AsyncMock
+from rdflib.plugins.sparql.parser import parseQuery
+from app.domain.models import Entity
+from app.infrastructure.config.settings import settings
+from app.infrastructure.repositories import additional_repositories, graphdb_repository
+from app.infrastructure.repositories.additional_repositories import (
+    HealthRecordRepository,
+    MapRepository,
+    SPARQLRepository,
+)
+from app.infrastructure.repositories.graphdb_repository import (
+    GraphDBClient,
+    EntityRepository,
+    EntityInfoRepository,
+)
+from app.infrastructure.repositories.query_cache import query_cache
+
+
+def _uri(value):
+    return {"type": "uri", "value": value}
+
+
+def _literal(value):
+    return {"type": "literal", "value": value}
+
+
+class _TrackedStream(httpx.AsyncByteStream):
+    """Response body that records whether it was closed"""
+    
+    def __init__(self, body):
+        self.body = body
+        self.closed = False
+    
+    async def __aiter__(self):
+        yield self.body
+    
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def clear_query_cache():
+    """Keep cached results from leaking between tests"""
+    query_cache.invalidate()
+    graphdb_repository._entity_type_cache.invalidate()
+    yield
+    query_cache.invalidate()
+    graphdb_repository._entity_type_cache.invalidate()
+
+
+@pytest.fixture
+def mock_graphdb_client():
+    """Mock GraphDB client"""
+    client = Mock()
+    client.query = AsyncMock()
+    return client
+
+
+class TestGraphDBClient:
+    """Test GraphDBClient"""
+    
+    @pytest.mark.asyncio
+    async def test_query_decodes_response_body(self):
+        """Should POST the query and decode the raw SPARQL JSON body"""
+        requests = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(
+                200, content=b'{"head": {"vars": ["s"]}, "results": {"bindings": []}}'
+            )
+        
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        
+        # Act
+        results = await client.query("SELECT ?s WHERE { ?s ?p ?o }")
+        
+        # Assert
+        assert results == {"head": {"vars": ["s"]}, "results": {"bindings": []}}
+        assert requests[0].method == "POST"
+        assert requests[0].headers["content-type"] == "application/sparql-query"
+        assert requests[0].content == b"SELECT ?s WHERE { ?s ?p ?o }"
+    
+    @pytest.mark.asyncio
+    async def test_check_syntax_returns_server_error_for_bad_query(self):
+        """A 400 from GraphDB is reported as the syntax error"""
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(400, content=b"MALFORMED QUERY: Encountered ...")
+        ))
+        
+        # Act
+        error = await client.check_syntax("SELEC ?s")
+        
+        # Assert
+        assert error == "MALFORMED QUERY: Encountered ..."
+    
+    @pytest.mark.asyncio
+    async def test_stream_relays_body_chunks(self):
+        """Should hand back the raw response body without decoding it"""
+        body = b'{"head": {"vars": ["s"]}, "results": {"bindings": []}}'
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=body)
+        ))
+        
+        # Act
+        chunks = [chunk async for chunk in await client.stream("SELECT ?s WHERE { ?s ?p ?o }")]
+        
+        # Assert
+        assert b"".join(chunks) == body
+    
+    @pytest.mark.asyncio
+    async def test_stream_closed_without_reading_releases_response(self):
+        """A body that is dropped before iteration still closes its response"""
+        upstream = _TrackedStream(b'{"results": {"bindings": []}}')
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, stream=upstream)
+        ))
+        body = await client.stream("SELECT ?s WHERE { ?s ?p ?o }")
+        
+        # Act
+        await body.aclose()
+        await body.aclose()
+        
+        # Assert
+        assert upstream.closed
+    
+    @pytest.mark.asyncio
+    async def test_stream_raises_before_yielding_on_error(self):
+        """Errors surface when the stream is opened, not mid-response"""
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(400, content=b"MALFORMED QUERY")
+        ))
+        
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.stream("SELEC ?s")
+    
+    @pytest.mark.asyncio
+    async def test_query_serves_cosmetic_repeats_from_cache(self):
+        """Queries differing only in case and whitespace hit GraphDB once"""
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._query_uncached = AsyncMock(return_value={"results": {"bindings": []}})
+        
+        # Act
+        first = await client.query("SELECT ?x WHERE { ?x ?p ?o }")
+        second = await client.query("select ?x\n  where {\n ?x ?p ?o\n}")
+        
+        # Assert
+        assert first is second
+        client._query_uncached.assert_called_once_with("SELECT ?x WHERE { ?x ?p ?o }")
+    
+    @pytest.mark.asyncio
+    async def test_query_without_cache_always_hits_graphdb(self):
+        """cache=False should neither read nor populate the cache"""
+        client = GraphDBClient("http://localhost:7200/repositories/test")
+        client._query_uncached = AsyncMock(return_value={"results": {"bindings": []}})
+        
+        # Act
+        await client.query("SELECT ?x WHERE { ?x ?p ?o }", cache=False)
+        await client.query("SELECT ?x WHERE { ?x ?p ?o }", cache=False)
+        
+        # Assert
+        assert client._query_uncached.call_count == 2
+        assert len(query_cache) == 0
+
+
+class TestEntityRepository:
+    """Test EntityRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_search_returns_page_and_total_from_one_query(self, mock_graphdb_client):
+        """Should read the page and the total count from a single response"""
+        search_response = {
+            "head": {"vars": ["entity", "label", "iso3Code", "count"]},
+            "results": {"bindings": [
+                {"entity": _uri("http://www.wikidata.org/entity/Q252"),
+                 "label": _literal("Indonesia"), "iso3Code": _literal("IDN"),
+                 "count": _literal("42")},
+            ]}
+        }
+        type_response = {"head": {"vars": ["type"]}, "results": {"bindings": []}}
+        mock_graphdb_client.query.side_effect = [search_response, type_response]
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        entities, total = await repo.search("indo", limit=1)
+        
+        # Assert
+        assert total == 42
+        assert [e.label for e in entities] == ["Indonesia"]
+        assert "COUNT(DISTINCT ?entity)" in mock_graphdb_client.query.call_args_list[0].args[0]
+    
+    @pytest.mark.asyncio
+    async def test_search_binds_user_text_as_escaped_literal(self, mock_graphdb_client):
+        """User text cannot break out of the query skeleton"""
+        mock_graphdb_client.query.return_value = {"results": {"bindings": []}}
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        await repo.search('x")) } DELETE WHERE { ?s ?p ?o } #')
+        
+        # Assert
+        sparql_query = mock_graphdb_client.query.call_args.args[0]
+        assert 'VALUES ?q { "x\\")) } DELETE WHERE { ?s ?p ?o } #" }' in sparql_query
+        assert "LCASE(?q)" in sparql_query
+        parseQuery(sparql_query)
+    
+    @pytest.mark.asyncio
+    async def test_search_past_last_page_keeps_total(self, mock_graphdb_client):
+        """A count-only row yields no entities but the total"""
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["entity", "label", "iso3Code", "count"]},
+            "results": {"bindings": [{"count": _literal("3")}]}
+        }
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        entities, total = await repo.search("indo", offset=20)
+        
+        # Assert
+        assert (entities, total) == ([], 3)
+        mock_graphdb_client.query.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_suggestions_uses_prefix_query_without_count(self, mock_graphdb_client):
+        """Suggestions should match label prefixes and skip the total count"""
+        suggest_response = {"results": {"bindings": [
+            {"entity": _uri("http://www.wikidata.org/entity/Q252"),
+             "label": _literal("Indonesia"), "iso3Code": _literal("IDN")},
+        ]}}
+        type_response = {"results": {"bindings": []}}
+        mock_graphdb_client.query.side_effect = [suggest_response, type_response]
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        entities = await repo.get_suggestions("Indo", limit=5)
+        
+        # Assert
+        assert [e.iso3_code for e in entities] == ["IDN"]
+        sparql_query = mock_graphdb_client.query.call_args_list[0].args[0]
+        assert "STRSTARTS(LCASE(?label), LCASE(?q))" in sparql_query
+        assert "COUNT" not in sparql_query
+        assert "LIMIT 5" in sparql_query
+        parseQuery(sparql_query)
+    
+    @pytest.mark.asyncio
+    async def test_entity_type_is_cached_across_repositories(self, mock_graphdb_client):
+        """A resolved type is reused; a failed lookup falls back without caching"""
+        mock_graphdb_client.query.side_effect = [
+            RuntimeError("GraphDB unavailable"),
+            {"results": {"bindings": [{"type": _uri("http://www.wikidata.org/entity/Q82794")}]}},
+        ]
+        entity_repo = EntityRepository(mock_graphdb_client)
+        info_repo = EntityInfoRepository(mock_graphdb_client)
+        entity_id = "http://www.wikidata.org/entity/Q7204"
+        
+        # Act
+        fallback = await entity_repo._determine_entity_type(entity_id)
+        first = await entity_repo._determine_entity_type(entity_id)
+        second = await info_repo._determine_entity_type(entity_id)
+        
+        # Assert
+        assert (fallback, first, second) == ("country", "region", "region")
+        assert mock_graphdb_client.query.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_search_uses_lucene_connector_when_enabled(self, mock_graphdb_client, monkeypatch):
+        """Lucene mode should probe the index instead of scanning with CONTAINS"""
+        monkeypatch.setattr(
+            graphdb_repository, "settings",
+            dataclasses.replace(settings, search_use_lucene=True, search_lucene_index="countries")
+        )
+        mock_graphdb_client.query.return_value = {"results": {"bindings": []}}
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        await repo.search("south east")
+        
+        # Assert
+        sparql_query = mock_graphdb_client.query.call_args.args[0]
+        assert "?search a inst:countries" in sparql_query
+        assert 'luc:query "south AND east*"' in sparql_query
+        assert "CONTAINS" not in sparql_query
+        parseQuery(sparql_query)
+    
+    @pytest.mark.asyncio
+    async def test_get_by_ids_fetches_all_entities_in_one_query(self, mock_graphdb_client):
+        """Should bind every ID into a single VALUES lookup"""
+        entities_response = {"results": {"bindings": [
+            {"entity": _uri("http://www.wikidata.org/entity/Q252"),
+             "label": _literal("Indonesia"), "iso3Code": _literal("IDN")},
+            {"entity": _uri("http://www.wikidata.org/entity/Q252"),
+             "label": _literal("Republik Indonesia")},
+            {"entity": _uri("http://www.wikidata.org/entity/Q836"),
+             "label": _literal("Myanmar")},
+        ]}}
+        type_response = {"results": {"bindings": []}}
+        mock_graphdb_client.query.side_effect = [entities_response, type_response, type_response]
+        repo = EntityRepository(mock_graphdb_client)
+        
+        # Act
+        entities = await repo.get_by_ids([
+            "http://www.wikidata.org/entity/Q252",
+            "http://www.wikidata.org/entity/Q836",
+            "http://www.wikidata.org/entity/Q999",
+        ])
+        
+        # Assert
+        assert {k: e.label for k, e in entities.items()} == {
+            "http://www.wikidata.org/entity/Q252": "Indonesia",
+            "http://www.wikidata.org/entity/Q836": "Myanmar",
+        }
+        sparql_query = mock_graphdb_client.query.call_args_list[0].args[0]
+        assert ("VALUES ?entity { <http://www.wikidata.org/entity/Q252> "
+                "<http://www.wikidata.org/entity/Q836> <http://www.wikidata.org/entity/Q999> }") in sparql_query
+        parseQuery(sparql_query)
+
+
+class TestEntityInfoRepository:
+    """Test EntityInfoRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_get_entity_info_runs_queries_concurrently(self, mock_graphdb_client):
+        """Independent lookups should be in flight at the same time"""
+        in_flight = 0
+        peak = 0
+        
+        async def query(sparql_query, cache=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "?description" in sparql_query:
+                return {"results": {"bindings": [{"label": _literal("Indonesia")}]}}
+            return {"results": {"bindings": []}}
+        
+        mock_graphdb_client.query = query
+        repo = EntityInfoRepository(mock_graphdb_client)
+        
+        # Act
+        info = await repo.get_entity_info("http://www.wikidata.org/entity/Q252")
+        
+        # Assert
+        assert info.label == "Indonesia"
+        assert peak > 1
+    
+    @pytest.mark.asyncio
+    async def test_capital_label_read_from_attributes_query(self, mock_graphdb_client):
+        """Should not issue a separate label query when ?capitalLabel is bound"""
+        mock_graphdb_client.query.return_value = {
+            "results": {"bindings": [{
+                "capital": _uri("http://www.wikidata.org/entity/Q3630"),
+                "capitalLabel": _literal("Jakarta"),
+            }]}
+        }
+        repo = EntityInfoRepository(mock_graphdb_client)
+        
+        # Act
+        attributes = await repo._get_attributes("http://www.wikidata.org/entity/Q252")
+        
+        # Assert
+        assert attributes[0].value_label == "Jakarta"
+        mock_graphdb_client.query.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_related_entities_returns_entities(self, mock_graphdb_client):
+        """Related entities should be plain Entity objects, in part-of then contains order"""
+        async def query(sparql_query, cache=True):
+            if "?entity wdt:P361 ?related" in sparql_query:
+                return {"results": {"bindings": [
+                    {"related": _uri("http://www.wikidata.org/entity/Q7204"),
+                     "label": _literal("Southeast Asia")},
+                ]}}
+            if "?related wdt:P361 ?entity" in sparql_query:
+                return {"results": {"bindings": [
+                    {"related": _uri("http://www.wikidata.org/entity/Q252"),
+                     "label": _literal("Indonesia"), "iso3Code": _literal("IDN")},
+                ]}}
+            return {"results": {"bindings": []}}
+        
+        mock_graphdb_client.query.side_effect = query
+        repo = EntityInfoRepository(mock_graphdb_client)
+        
+        # Act
+        related = await repo.get_related_entities("http://kg.gaung.org/entity/asean")
+        
+        # Assert
+        assert all(isinstance(e, Entity) for e in related)
+        assert [(e.label, e.iso3_code) for e in related] == [
+            ("Southeast Asia", None), ("Indonesia", "IDN")
+        ]
+
+
+class TestHealthRecordRepository:
+    """Test HealthRecordRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_get_by_location_pivots_metric_rows(self, mock_graphdb_client):
+        """Should group (record, predicate, value) rows into records"""
+        kgp = settings.kg_property_ns
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["record", "year", "p", "v"]},
+            "results": {"bindings": [
+                {"record": _uri("r2020"), "year": _literal("2020"),
+                 "p": _uri(kgp + "hivCases"), "v": _literal("1000")},
+                {"record": _uri("r2020"), "year": _literal("2020"),
+                 "p": _uri(kgp + "bcg"), "v": _literal("95.5")},
+                {"record": _uri("r2019"), "year": _literal("2019")},
+            ]}
+        }
+        repo = HealthRecordRepository(mock_graphdb_client)
+        
+        # Act
+        records = await repo.get_by_location("http://www.wikidata.org/entity/Q252")
+        
+        # Assert
+        assert [r.id for r in records] == ["r2020", "r2019"]
+        assert records[0].year == 2020
+        assert records[0].hiv_cases == 1000.0
+        assert records[0].bcg == 95.5
+        assert records[0].malaria_cases is None
+        assert records[1].hiv_cases is None
+    
+    @pytest.mark.asyncio
+    async def test_get_by_locations_groups_by_location(self, mock_graphdb_client):
+        """Should fetch several locations in one query and group by ?loc"""
+        kgp = settings.kg_property_ns
+        q252 = "http://www.wikidata.org/entity/Q252"
+        q668 = "http://www.wikidata.org/entity/Q668"
+        q17 = "http://www.wikidata.org/entity/Q17"
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["loc", "record", "year", "p", "v"]},
+            "results": {"bindings": [
+                {"loc": _uri(q252), "record": _uri("r1"), "year": _literal("2020"),
+                 "p": _uri(kgp + "bcg"), "v": _literal("90")},
+                {"loc": _uri(q668), "record": _uri("r2"), "year": _literal("2020"),
+                 "p": _uri(kgp + "bcg"), "v": _literal("80")},
+                {"loc": _uri(q252), "record": _uri("r3"), "year": _literal("2019")},
+            ]}
+        }
+        repo = HealthRecordRepository(mock_graphdb_client)
+        
+        # Act
+        by_location = await repo.get_by_locations([q252, q668, q17])
+        
+        # Assert
+        mock_graphdb_client.query.assert_called_once()
+        sparql_query = mock_graphdb_client.query.call_args.args[0]
+        assert f"VALUES ?loc {{ <{q252}> <{q668}> <{q17}> }}" in sparql_query
+        assert [r.id for r in by_location[q252]] == ["r1", "r3"]
+        assert by_location[q668][0].bcg == 80.0
+        assert by_location[q668][0].location == q668
+        assert by_location[q17] == []
+    
+    @pytest.mark.asyncio
+    async def test_location_is_bound_through_values(self, mock_graphdb_client):
+        """Should bind the location IRI in a VALUES clause"""
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["year"]},
+            "results": {"bindings": []}
+        }
+        repo = HealthRecordRepository(mock_graphdb_client)
+        
+        # Act
+        await repo.get_available_years("http://www.wikidata.org/entity/Q252")
+        
+        # Assert
+        sparql_query = mock_graphdb_client.query.call_args.args[0]
+        assert "VALUES ?loc { <http://www.wikidata.org/entity/Q252> }" in sparql_query
+        assert "schema:location ?loc" in sparql_query
+    
+    @pytest.mark.asyncio
+    async def test_malformed_metric_value_raises(self, mock_graphdb_client):
+        """Should fail fast on a non-numeric metric literal"""
+        kgp = settings.kg_property_ns
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["record", "year", "p", "v"]},
+            "results": {"bindings": [
+                {"record": _uri("r2020"), "year": _literal("2020"),
+                 "p": _uri(kgp + "bcg"), "v": _literal("n/a")},
+            ]}
+        }
+        repo = HealthRecordRepository(mock_graphdb_client)
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await repo.get_by_location("http://www.wikidata.org/entity/Q252")
+    
+    @pytest.mark.asyncio
+    async def test_available_years_are_parsed_as_ints(self, mock_graphdb_client):
+        """Should return the years in query order as integers"""
+        mock_graphdb_client.query.return_value = {
+            "head": {"vars": ["year"]},
+            "results": {"bindings": [{"year": _literal("2021")}, {"year": _literal("2019")}]}
+        }
+        repo = HealthRecordRepository(mock_graphdb_client)
+        
+        # Act
+        years = await repo.get_available_years("http://www.wikidata.org/entity/Q252")
+        
+        # Assert
+        assert years == [2021, 2019]
+        mock_graphdb_client.query.assert_called_once()
+
+
+class TestMapRepository:
+    """Test MapRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_country_coordinates_are_static(self, mock_graphdb_client):
+        """Should return the shared immutable tuple without querying GraphDB"""
+        repo = MapRepository(mock_graphdb_client)
+        
+        # Act
+        first = await repo.get_all_country_coordinates()
+        second = await repo.get_all_country_coordinates()
+        
+        # Assert
+        assert isinstance(first, tuple)
+        assert first is second
+        assert first[0].iso3_code == "IDN"
+        mock_graphdb_client.query.assert_not_called()
+
+
+class TestSPARQLRepository:
+    """Test SPARQLRepository"""
+    
+    @pytest.mark.asyncio
+    async def test_execute_query_round_trips_response(self, mock_graphdb_client):
+        """to_dict should rebuild the GraphDB response; user queries skip the cache"""
+        response = {
+            "head": {"vars": ["s"]},
+            "results": {"bindings": [{"s": _uri("http://ex.org/a")}]}
+        }
+        mock_graphdb_client.query.return_value = response
+        repo = SPARQLRepository(mock_graphdb_client)
+        
+        # Act
+        result = await repo.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
+        
+        # Assert
+        assert result.variables == ["s"]
+        assert result.to_dict() == response
+        mock_graphdb_client.query.assert_called_once_with(
+            "SELECT ?s WHERE { ?s ?p ?o }", cache=False
+        )
+    
+    @pytest.mark.asyncio
+    async def test_sample_queries_are_shared(self, mock_graphdb_client):
+        """Should return the same module-level tuple on every call"""
+        repo = SPARQLRepository(mock_graphdb_client)
+        
+        # Act
+        first = await repo.get_sample_queries()
+        second = await repo.get_sample_queries()
+        
+        # Assert
+        assert isinstance(first, tuple)
+        assert first is second
+        assert len(first) == 4
+    
+    @pytest.mark.asyncio
+    async def test_validate_query_parses_locally(self, mock_graphdb_client):
+        """Should accept a well-formed query without contacting GraphDB"""
+        repo = SPARQLRepository(mock_graphdb_client)
+        
+        # Act
+        is_valid, error = await repo.validate_query("SELECT ?s WHERE { ?s ?p ?o }")
+        
+        # Assert
+        assert is_valid is True
+        assert error is None
+        mock_graphdb_client.query.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_validate_query_reports_syntax_error(self, mock_graphdb_client):
+        """Should reject a malformed query with the parser message"""
+        repo = SPARQLRepository(mock_graphdb_client)
+        
+        # Act
+        is_valid, error = await repo.validate_query("SELECT ?s WHERE { ?s ?p ")
+        
+        # Assert
+        assert is_valid is False
+        assert error
+        mock_graphdb_client.query.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_server_validation_sends_query_unmodified(self, mock_graphdb_client, monkeypatch):
+        """Server-side validation should not splice LIMIT into the query"""
+        monkeypatch.setattr(
+            additional_repositories, "settings",
+            dataclasses.replace(settings, sparql_validate_on_server=True)
+        )
+        mock_graphdb_client.check_syntax = AsyncMock(return_value="Unknown prefix: foo")
+        repo = SPARQLRepository(mock_graphdb_client)
+        query = "SELECT ?s WHERE { ?s foo:p ?o } # trailing comment"
+        
+        # Act
+        is_valid, error = await repo.validate_query(query)
+        
+        # Assert
+        assert (is_valid, error) == (False, "Unknown prefix: foo")
+        mock_graphdb_client.check_syntax.assert_called_once_with(
+            query, settings.sparql_validate_timeout
+        )
+        mock_graphdb_client.query.assert_not_called()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the response caching middleware
+"""
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+from app.presentation.middleware.response_cache import ResponseCacheMiddleware
+
+
+@pytest.fixture
+def app_and_calls():
+    """Small app counting how often each handler actually runs"""
+    app = FastAPI()
+    calls = {"countries": 0, "missing": 0, "live": 0}
+    
+    @app.get("/api/map/countries")
+    async def countries(region: str = "all"):
+        calls["countries"] += 1
+        return {"region": region, "call": calls["countries"]}
+    
+    @app.get("/api/map/missing")
+    async def missing():
+        calls["missing"] += 1
+        raise HTTPException(status_code=404, detail="Not found")
+    
+    @app.get("/api/live")
+    async def live():
+        calls["live"] += 1
+        return {"call": calls["live"]}
+    
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        rules=(("/api/map/", 3600),)
+    )
+    return app, calls
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class TestResponseCacheMiddleware:
+    """Test ResponseCacheMiddleware"""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_get_is_served_from_cache(self, app_and_calls):
+        """Second identical request should not reach the handler"""
+        app, calls = app_and_calls
+        
+        # Act
+        async with _client(app) as client:
+            first = await client.get("/api/map/countries")
+            second = await client.get("/api/map/countries")
+        
+        # Assert
+        assert first.json() == second.json() == {"region": "all", "call": 1}
+        assert calls["countries"] == 1
+        assert second.headers["cache-control"] == "public, max-age=3600, stale-while-revalidate=60"
+    
+    @pytest.mark.asyncio
+    async def test_query_string_is_part_of_key(self, app_and_calls):
+        """Different query parameters should be cached separately"""
+        app, calls = app_and_calls
+        
+        # Act
+        async with _client(app) as client:
+            asia = await client.get("/api/map/countries?region=asia")
+            africa = await client.get("/api/map/countries?region=africa")
+        
+        # Assert
+        assert asia.json()["region"] == "asia"
+        assert africa.json()["region"] == "africa"
+        assert calls["countries"] == 2
+    
+    @pytest.mark.asyncio
+    async def test_errors_and_unmatched_paths_are_not_cached(self, app_and_calls):
+        """Only successful responses under a rule's prefix are cached"""
+        app, calls = app_and_calls
+        
+        # Act
+        async with _client(app) as client:
+            for _ in range(2):
+                await client.get("/api/map/missing")
+                live = await client.get("/api/live")
+        
+        # Assert
+        assert calls == {"countries": 0, "missing": 2, "live": 2}
+        assert "cache-control" not in live.headers
@@ -2,38 +2,97 @@
 Unit tests for services
 Testing business logic in application layer
 """
+import asyncio
+import dataclasses
 import pytest
-from unittest.mock import Mock, AsyncMock
-from app.application.services import SearchService, EntityInfoService
-from app.domain.models import Entity, EntityInfo, HealthRecord
+from types import SimpleNamespace
+from app.application.services import (
+    SearchService, EntityInfoService, MapService, SPARQLQueryService
+)
+from app.domain.models import (
+    Entity, EntityInfo, HealthRecord, HealthMetricItem, CountryCoordinates
+)
 
 
+class _AsyncStub:
+    """Async callable that records its calls and returns a preset value"""
+    
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+    
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+    
+    @property
+    def call_count(self):
+        return len(self.calls)
+    
+    def assert_called_once(self):
+        assert len(self.calls) == 1
+    
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)]
+    
+    def assert_not_called(self):
+        assert not self.calls
+    
+    def reset(self):
+        self.return_value = None
+        self.calls.clear()
+
+
+def _reset_stubs(repo):
+    for stub in vars(repo).values():
+        stub.reset()
+
+
+@pytest.fixture(scope="module")
+def _entity_repository():
+    return SimpleNamespace(
+        search=_AsyncStub(),
+        get_by_id=_AsyncStub(),
+        get_suggestions=_AsyncStub()
+    )
+
+
+@pytest.fixture(scope="module")
+def _entity_info_repository():
+    return SimpleNamespace(
+        get_entity_info=_AsyncStub(),
+        get_related_entities=_AsyncStub()
+    )
+
+
+@pytest.fixture(scope="module")
+def _health_record_repository():
+    return SimpleNamespace(
+        get_by_location=_AsyncStub(),
+        get_available_years=_AsyncStub()
+    )
+
+
+# Repository stubs are built once per module and reset after each test
 @pytest.fixture
-def mock_entity_repository():
+def mock_entity_repository(_entity_repository):
     """Mock entity repository"""
-    repo = Mock()
-    repo.search = AsyncMock()
-    repo.get_by_id = AsyncMock()
-    repo.get_suggestions = AsyncMock()
-    return repo
+    yield _entity_repository
+    _reset_stubs(_entity_repository)
 
 
 @pytest.fixture
-def mock_entity_info_repository():
+def mock_entity_info_repository(_entity_info_repository):
     """Mock entity info repository"""
-    repo = Mock()
-    repo.get_entity_info = AsyncMock()
-    repo.get_related_entities = AsyncMock()
-    return repo
+    yield _entity_info_repository
+    _reset_stubs(_entity_info_repository)
 
 
 @pytest.fixture
-def mock_health_record_repository():
+def mock_health_record_repository(_health_record_repository):
     """Mock health record repository"""
-    repo = Mock()
-    repo.get_by_location = AsyncMock()
-    repo.get_available_years = AsyncMock()
-    return repo
+    yield _health_record_repository
+    _reset_stubs(_health_record_repository)
 
 
 class TestSearchService:
@@ -126,9 +185,89 @@ class TestEntityInfoService:
         # Assert
         assert result is not None
         assert result.id == "1"
-        assert result.health_metrics is not None
+        assert result.health_metrics.disease_cases.to_items() == [
+            HealthMetricItem("hivCases", "HIV/AIDS Cases", 1000, 2020, "cases", "disease")
+        ]
+        assert len(result.health_metrics.vaccination_coverage) == 0
         mock_entity_info_repository.get_entity_info.assert_called_once_with("1")
     
+    @pytest.mark.asyncio
+    async def test_available_years_are_unique_and_descending(
+        self, mock_entity_info_repository, mock_health_record_repository
+    ):
+        """Should list each year with data once, newest first"""
+        mock_entity_info_repository.get_entity_info.return_value = EntityInfo(
+            id="1", label="Indonesia", type="country"
+        )
+        mock_health_record_repository.get_by_location.return_value = [
+            HealthRecord(id="r1", location="1", year=2010, hiv_cases=10),
+            HealthRecord(id="r2", location="1", year=2020, bcg=90),
+            HealthRecord(id="r3", location="1", year=2010, dtp3=85),
+            HealthRecord(id="r4", location="1", year=2015)
+        ]
+        
+        service = EntityInfoService(
+            mock_entity_info_repository,
+            mock_health_record_repository
+        )
+        
+        # Act
+        result = await service.get_entity_info("1")
+        
+        # Assert
+        assert result.health_metrics.available_years == [2020, 2010]
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("attr", [
+        f.name for f in dataclasses.fields(HealthRecord) if f.name not in ("id", "location", "year")
+    ])
+    async def test_every_health_field_counts_as_data(
+        self, attr, mock_entity_info_repository, mock_health_record_repository
+    ):
+        """A year with any single metric attribute set should be available"""
+        mock_entity_info_repository.get_entity_info.return_value = EntityInfo(
+            id="1", label="Indonesia", type="country"
+        )
+        mock_health_record_repository.get_by_location.return_value = [
+            HealthRecord(id="r1", location="1", year=2020, **{attr: 1.0})
+        ]
+        
+        service = EntityInfoService(
+            mock_entity_info_repository,
+            mock_health_record_repository
+        )
+        
+        # Act
+        result = await service.get_entity_info("1")
+        
+        # Assert
+        assert result.health_metrics.available_years == [2020]
+    
+    @pytest.mark.asyncio
+    async def test_available_years_include_years_before_1900(
+        self, mock_entity_info_repository, mock_health_record_repository
+    ):
+        """Unvalidated early years should be listed alongside their metrics"""
+        mock_entity_info_repository.get_entity_info.return_value = EntityInfo(
+            id="1", label="Indonesia", type="country"
+        )
+        mock_health_record_repository.get_by_location.return_value = [
+            HealthRecord(id="r1", location="1", year=2000, hiv_cases=10),
+            HealthRecord(id="r2", location="1", year=1850, hiv_cases=5)
+        ]
+        
+        service = EntityInfoService(
+            mock_entity_info_repository,
+            mock_health_record_repository
+        )
+        
+        # Act
+        result = await service.get_entity_info("1")
+        
+        # Assert
+        assert result.health_metrics.available_years == [2000, 1850]
+        assert list(result.health_metrics.disease_cases.years) == [2000, 1850]
+    
     @pytest.mark.asyncio
     async def test_get_entity_info_returns_none_if_not_found(
         self, mock_entity_info_repository, mock_health_record_repository
@@ -146,3 +285,111 @@ class TestEntityInfoService:
         
         # Assert
         assert result is None
+
+
+class TestMapService:
+    """Test MapService"""
+    
+    @pytest.mark.asyncio
+    async def test_country_coordinates_are_cached(self):
+        """Should hit the repository once until the cache is invalidated"""
+        coords = [
+            CountryCoordinates(iso3_code="IDN", label="Indonesia", latitude=-0.7893, longitude=113.9213)
+        ]
+        repo = SimpleNamespace(get_all_country_coordinates=_AsyncStub(coords))
+        service = MapService(repo)
+        
+        # Act
+        first = await service.get_all_country_coordinates()
+        second = await service.get_all_country_coordinates()
+        
+        # Assert
+        assert first == second == coords
+        repo.get_all_country_coordinates.assert_called_once()
+        
+        service.invalidate_cache()
+        await service.get_all_country_coordinates()
+        assert repo.get_all_country_coordinates.call_count == 2
+
+
+class TestSPARQLQueryService:
+    """Test SPARQLQueryService"""
+    
+    @pytest.mark.asyncio
+    async def test_sample_queries_are_cached(self):
+        """Should fetch sample queries from the repository once"""
+        repo = SimpleNamespace(get_sample_queries=_AsyncStub(["SELECT * WHERE { ?s ?p ?o }"]))
+        service = SPARQLQueryService(repo)
+        
+        # Act
+        await service.get_sample_queries()
+        queries = await service.get_sample_queries()
+        
+        # Assert
+        assert queries == ["SELECT * WHERE { ?s ?p ?o }"]
+        repo.get_sample_queries.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_execute_query_appends_limit(self):
+        """Should append LIMIT when the query has none"""
+        repo = SimpleNamespace(execute_query=_AsyncStub())
+        service = SPARQLQueryService(repo)
+        
+        # Act
+        await service.execute_query("SELECT * WHERE { ?s ?p ?o }\n", limit=5)
+        
+        # Assert
+        repo.execute_query.assert_called_once_with("SELECT * WHERE { ?s ?p ?o } LIMIT 5")
+    
+    @pytest.mark.asyncio
+    async def test_stream_query_appends_limit(self):
+        """Streaming should apply the same LIMIT handling"""
+        repo = SimpleNamespace(stream_query=_AsyncStub())
+        service = SPARQLQueryService(repo)
+        
+        # Act
+        await service.stream_query("SELECT * WHERE { ?s ?p ?o }", limit=5)
+        
+        # Assert
+        repo.stream_query.assert_called_once_with("SELECT * WHERE { ?s ?p ?o } LIMIT 5")
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", [
+        "SELECT * WHERE { ?s ?p ?o } LIMIT 10",
+        "SELECT * WHERE { ?s ?p ?o } limit 10 offset 20\n",
+    ])
+    async def test_execute_query_keeps_existing_limit(self, query):
+        """Should not add a second LIMIT"""
+        repo = SimpleNamespace(execute_query=_AsyncStub())
+        service = SPARQLQueryService(repo)
+        
+        # Act
+        await service.execute_query(query, limit=5)
+        
+        # Assert
+        repo.execute_query.assert_called_once_with(query)
+    
+    @pytest.mark.asyncio
+    async def test_execute_batch_preserves_order_and_bounds_concurrency(self):
+        """Should return results in input order without exceeding concurrency"""
+        in_flight = 0
+        peak = 0
+        
+        async def execute(query):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return query
+        
+        repo = SimpleNamespace(execute_query=execute)
+        service = SPARQLQueryService(repo)
+        queries = [f"SELECT * WHERE {{ ?s ?p {i} }}" for i in range(10)]
+        
+        # Act
+        results = await service.execute_batch(queries, concurrency=3)
+        
+        # Assert
+        assert results == queries
+        assert peak == 3
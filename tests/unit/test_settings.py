@@ -0,0 +1,58 @@
+"""
+Unit tests for application settings
+"""
+import pytest
+from app.infrastructure.config.settings import Settings
+
+
+class TestSettings:
+    """Test Settings.from_env"""
+    
+    def test_defaults_without_environment(self):
+        """Should fall back to defaults when nothing is set"""
+        settings = Settings.from_env(environ={}, env_file=None)
+        
+        assert settings == Settings()
+    
+    def test_environment_is_case_insensitive_and_coerced(self):
+        """Should match names case-insensitively and coerce int/bool fields"""
+        settings = Settings.from_env(
+            environ={"API_PORT": "8080", "Api_Reload": "false", "LOG_LEVEL": "DEBUG"},
+            env_file=None
+        )
+        
+        assert settings.api_port == 8080
+        assert settings.api_reload is False
+        assert settings.log_level == "DEBUG"
+    
+    def test_environment_overrides_env_file(self, tmp_path):
+        """Process environment takes precedence over the .env file"""
+        env_file = tmp_path / ".env"
+        env_file.write_text("GRAPHDB_URL=http://from-file:7200\nLOG_LEVEL=WARNING\n")
+        
+        settings = Settings.from_env(
+            environ={"LOG_LEVEL": "ERROR"},
+            env_file=str(env_file)
+        )
+        
+        assert settings.graphdb_url == "http://from-file:7200"
+        assert settings.log_level == "ERROR"
+    
+    def test_invalid_bool_raises(self):
+        """Should reject unrecognised boolean values"""
+        with pytest.raises(ValueError):
+            Settings.from_env(environ={"API_RELOAD": "maybe"}, env_file=None)
+    
+    def test_settings_are_frozen(self):
+        """Settings cannot be mutated after load"""
+        settings = Settings()
+        
+        with pytest.raises(AttributeError):
+            settings.log_level = "DEBUG"
+    
+    def test_cors_origins_parsed_once(self):
+        """Should split and strip CORS origins into a reused tuple"""
+        settings = Settings(cors_origins="http://a.test, http://b.test")
+        
+        assert settings.cors_origins_list == ("http://a.test", "http://b.test")
+        assert settings.cors_origins_list is settings.cors_origins_list
@@ -0,0 +1,51 @@
+"""
+Unit tests for SPARQL query canonicalization
+"""
+from app.infrastructure.repositories.sparql_normalize import canonicalize
+
+
+class TestCanonicalize:
+    """Test canonicalize"""
+    
+    def test_collapses_whitespace_and_comments(self):
+        """Comments and whitespace runs collapse to single spaces"""
+        query = "SELECT ?x\n  WHERE {  # find things\n\t?x ?p ?o }\n"
+        
+        assert canonicalize(query) == "select ?x where { ?x ?p ?o }"
+    
+    def test_lowercases_keywords_and_functions(self):
+        """Keywords and built-in functions are case-insensitive"""
+        upper = 'SELECT ?x WHERE { ?x ?p ?o FILTER(CONTAINS(LCASE(?o), "a")) } LIMIT 5'
+        lower = 'select ?x where { ?x ?p ?o filter(contains(lcase(?o), "a")) } limit 5'
+        
+        assert canonicalize(upper) == canonicalize(lower)
+    
+    def test_preserves_variables_and_prefixed_names(self):
+        """Variables and prefixed names that look like keywords keep their case"""
+        query = "SELECT ?Select WHERE { ?Select kgp:Year ?Limit }"
+        
+        assert canonicalize(query) == "select ?Select where { ?Select kgp:Year ?Limit }"
+    
+    def test_preserves_strings_and_iris(self):
+        """String literals and IRIs are never rewritten"""
+        query = 'SELECT ?x WHERE { ?x <http://ex.org/A#SELECT> "Foo  # LIMIT" }'
+        
+        assert canonicalize(query) == (
+            'select ?x where { ?x <http://ex.org/A#SELECT> "Foo  # LIMIT" }'
+        )
+    
+    def test_sorts_prefix_declarations(self):
+        """Leading PREFIX declarations are order-insensitive"""
+        first = (
+            "PREFIX schema: <http://schema.org/>\n"
+            "PREFIX kgp: <http://kg.org/>\n"
+            "SELECT ?x WHERE { ?x ?p ?o }"
+        )
+        second = (
+            "PREFIX kgp: <http://kg.org/>\n"
+            "PREFIX schema: <http://schema.org/>\n"
+            "SELECT ?x WHERE { ?x ?p ?o }"
+        )
+        
+        assert canonicalize(first) == canonicalize(second)
+        assert canonicalize(first).startswith("prefix kgp: <http://kg.org/> prefix schema:")
@@ -0,0 +1,40 @@
+"""
+Unit tests for SPARQL term serialization
+"""
+from app.infrastructure.repositories.sparql_terms import iri, lucene_prefix_query, string_literal
+
+
+class TestIri:
+    """Test iri"""
+    
+    def test_wraps_plain_iri(self):
+        """A valid IRI is wrapped unchanged"""
+        assert iri("http://www.wikidata.org/entity/Q252") == "<http://www.wikidata.org/entity/Q252>"
+    
+    def test_percent_encodes_unsafe_characters(self):
+        """Characters that could close the IRI are percent-encoded"""
+        assert iri("http://x.org/a> } DROP ALL {") == "<http://x.org/a%3E%20%7D%20DROP%20ALL%20%7B>"
+
+
+class TestStringLiteral:
+    """Test string_literal"""
+    
+    def test_quotes_plain_value(self):
+        """A plain value is double-quoted"""
+        assert string_literal("IDN") == '"IDN"'
+    
+    def test_escapes_quotes_and_backslashes(self):
+        """Quotes, backslashes and newlines cannot end the literal"""
+        assert string_literal('a"b\\c\nd') == '"a\\"b\\\\c\\nd"'
+
+
+class TestLucenePrefixQuery:
+    """Test lucene_prefix_query"""
+    
+    def test_requires_all_words_with_last_as_prefix(self):
+        """Every word must match; the last one may be incomplete"""
+        assert lucene_prefix_query("south  east") == "south AND east*"
+    
+    def test_escapes_query_syntax(self):
+        """Lucene operators in user text are matched literally"""
+        assert lucene_prefix_query('a+b (c):"d"') == 'a\\+b AND \\(c\\)\\:\\"d\\"*'